@@ -15,9 +15,32 @@ __email__ = "rohitsuratekar@gmail.com"
 __license__ = "MIT License"
 __status__ = "Prototype"
 
-from SecretPlots.graphs.categorical import (BarPlot,
-                                            ColorPlot,
-                                            BooleanPlot,
-                                            BarGroupedPlot)
+import importlib
 
-from SecretPlots.network.graphs import NetworkPlot, Space
+# Plots are imported only when they are first used, so that importing the
+# package (or only its data and network helpers) does not load matplotlib
+_LAZY_IMPORTS = {
+    "BarPlot": "SecretPlots.graphs.categorical",
+    "ColorPlot": "SecretPlots.graphs.categorical",
+    "BooleanPlot": "SecretPlots.graphs.categorical",
+    "BarGroupedPlot": "SecretPlots.graphs.categorical",
+    "HistPlot": "SecretPlots.graphs.categorical",
+    "NetworkPlot": "SecretPlots.network.graphs",
+    "Space": "SecretPlots.network.graphs",
+    "FigurePool": "SecretPlots.managers",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError("module '{}' has no attribute '{}'".format(
+            __name__, name))
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -9,5 +9,7 @@
 #
 
 from SecretPlots.assemblers._base import Assembler
-from SecretPlots.assemblers._bars import BarAssembler, BarGroupedAssembler
+from SecretPlots.assemblers._bars import (BarAssembler,
+                                          BarGroupedAssembler,
+                                          HistAssembler)
 from SecretPlots.assemblers._matrix import ColorMapAssembler, BooleanAssembler
@@ -12,10 +12,11 @@
 
 import numpy as np
 
-from SecretPlots.assemblers import Assembler
+from SecretPlots.assemblers._base import Assembler, unique_ticks
 from SecretPlots.constants.graph import *
 from SecretPlots.managers import (BarLocations,
                                   BarGroupLocations,
+                                  HistLocations,
                                   LocationManager)
 from SecretPlots.objects import Data
 
@@ -45,37 +46,31 @@ class BarAssembler(Assembler):
             if self.em.show_legends is None:
                 self.em.show_legends = True
 
-    def _draw_elements(self):
-        locations = self.lm.get(self.data)
-        for loc, val, pos in zip(locations, self.data.value,
-                                 self.data.positions):
-            x, y = loc
-            if self.am.orientation == "y":
-                x, y = y, x
-
-            shape = self.om.get(x, y, val, pos)
-            if not np.isnan(val) or self.om.show_missing:
-                if np.isnan(val):
-                    self.am.major.add_missing_region(
-                        [x, y][self.am.major.index], self.om.width)
-                else:
-                    self.ax.add_patch(shape.get())
-            self.em.draw_values(shape, val, self.cm.color(pos, val))
-
-        ticks = []
-        edge = []
-        for i, m in enumerate(locations):
-            if i == 0:
-                edge.append(m[0])
-            elif i == len(locations) - 1:
-                edge.append(m[0] + self.om.width)
-            temp = round(m[0] + self.om.width / 2, 2)
-            if temp not in ticks:
-                ticks.append(temp)
-
-        self.am.major.make_ticks(ticks)
+    def _draw_elements(self, start=0):
+        locations = self.lm.get_array(self.data)
+        self._draw_missing_regions(locations, start)
+        positions = self.data.positions[start:]
+        mask = self.data.mask[start:]
+        values = self.data.value[start:]
+        if mask.any():
+            values = np.where(mask, np.nan, values)
+        colors = self.cm.colors(positions, values)
+        # Labels should fit only across the bars
+        fit = (True, False) if self.am.orientation == "x" else (False, True)
+        self._draw_shapes(locations[start:], values, positions, mask, colors,
+                          values, fit)
+
+        major = locations[:, 0]
+        edge = [major[0]]
+        if len(major) > 1:
+            edge.append(major[-1] + self.om.width)
+
+        self.am.major.make_ticks(unique_ticks(major + self.om.width / 2))
         self.am.major.edgelines = edge
-        self.am.major.make_labels()
+        if self.type == PLOT_BAR:
+            self.am.major.make_labels(self.data.column_labels)
+        else:
+            self.am.major.make_labels(self.data.row_labels)
 
     def draw(self):
         self._adjust_defaults()
@@ -100,54 +95,91 @@ class BarGroupedAssembler(Assembler):
         if self.em.show_legends is None:
             self.em.show_legends = True
 
-    def _draw_elements(self):
-        locations = self.lm.get(self.data)
-        for loc, val, pos in zip(locations, self.data.value,
-                                 self.data.positions):
-            x, y = loc
-            if self.am.orientation == "y":
-                x, y = y, x
-
-            shape = self.om.get(x, y, val, pos)
-            if not np.isnan(val) or self.om.show_missing:
-                if np.isnan(val):
-                    self.am.major.add_missing_region(
-                        [x, y][self.am.major.index], self.om.width)
-                else:
-                    self.ax.add_patch(shape.get())
-            self.em.draw_values(shape, val, self.cm.color(pos, val))
-
-        ticks = []
-        edge = []
-        current_group = 0
-        last_item = None
-        for pos, loc in zip(self.data.positions, locations):
-            if current_group == pos[0]:
-                current_group += 1
-                if last_item is not None:
-                    edge.append(last_item)
-                edge.append(loc)
-            last_item = loc
-        edge.append(last_item)
-        edge = [x[0] for x in edge]
-        midlines = []
-        for e in range(len(edge)):
-            if e % 2 == 1:
-                edge[e] += self.om.width
-                ticks.append((edge[e - 1] + edge[e]) / 2)
-                try:
-                    midlines.append((edge[e] + edge[e + 1]) / 2)
-                except IndexError:
-                    pass
+    def _draw_elements(self, start=0):
+        locations = self.lm.get_array(self.data)
+        self._draw_missing_regions(locations, start)
+        positions = self.data.positions[start:]
+        mask = self.data.mask[start:]
+        values = self.data.value[start:]
+        if mask.any():
+            values = np.where(mask, np.nan, values)
+        colors = self.cm.colors(positions, values)
+        # Labels should fit only across the bars
+        fit = (True, False) if self.am.orientation == "x" else (False, True)
+        self._draw_shapes(locations[start:], values, positions, mask, colors,
+                          values, fit)
+
+        # Edges of each group are its first and last bar
+        groups = self.data.positions[:, 0]
+        first = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+        last = np.r_[first[1:] - 1, len(groups) - 1]
+        starts = locations[first, 0]
+        ends = locations[last, 0] + self.om.width
+        edge = np.column_stack((starts, ends)).reshape(-1).tolist()
+        ticks = ((starts + ends) / 2).tolist()
+        midlines = ((ends[:-1] + starts[1:]) / 2).tolist()
 
         self.am.major.make_ticks(ticks)
         self.am.major.edgelines = edge
         self.am.major.midlines = midlines
 
-        self.am.major.make_labels()
+        self.am.major.make_labels(self.data.row_labels)
 
     def draw(self):
         self._adjust_defaults()
         self._draw_elements()
         self._draw_axis()
         self._draw_extra()
+
+
+class HistAssembler(BarAssembler):
+    """
+    Histogram drawn as bars. Data of this assembler are the bin heights
+    from 'HistLocations', values are binned with 'add'
+    """
+
+    def __init__(self, fig, log):
+        super().__init__(fig, log)
+        self._bars = []
+
+    @property
+    def type(self):
+        return PLOT_HIST
+
+    @property
+    def main_location_manager(self) -> HistLocations:
+        return HistLocations(self.am, self.om, self._log)
+
+    def add(self, data):
+        """
+        Bins the given values and updates the data with new bin heights
+        """
+        self.lm.add(data)
+        self.data = Data(self.lm.values.tolist(), self._log)
+
+    def _adjust_defaults(self):
+        if not self.am.major.is_user_defined_gap:
+            self.am.major.gap = 0
+        self.am.minor.padding_start = self.am.minor.padding_start or 0
+
+    def _draw_elements(self, start=0):
+        # Every bin can change with new values, hence always redrawn
+        for artist in self._bars:
+            artist.remove()
+        self._bars = []
+        self.em.clear_values()
+
+        locations = self.lm.get_array(self.data)
+        positions = self.data.positions
+        values = self.data.value
+        mask = self.data.mask
+        colors = self.cm.colors(positions, values)
+        fit = (True, False) if self.am.orientation == "x" else (False, True)
+        self._bars = self._draw_shapes(locations, values, positions, mask,
+                                       colors, values, fit)
+
+        ticks = np.append(locations[:, 0], locations[-1, 0] + self.om.width)
+        self.am.major.make_ticks(list(ticks))
+        self.am.major.edgelines = [ticks[0], ticks[-1]]
+        self.am.major.make_labels(["{:.3g}".format(x)
+                                   for x in self.lm.edges])
@@ -9,16 +9,30 @@
 #
 # All graph managers
 
-import matplotlib.pyplot as plt
+import matplotlib
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
 
 from SecretPlots.managers import *
-from SecretPlots.objects import Data
+from SecretPlots.managers._extra import label_size
+from SecretPlots.objects import Data, Axis
 from SecretPlots.utils import Log
 
 
+def unique_ticks(values) -> list:
+    """
+    Tick positions rounded to 2 decimals, without duplicates and in the
+    order of their first appearance
+    """
+    values = np.round(np.asarray(values, dtype=float).reshape(-1), 2)
+    _, first = np.unique(values, return_index=True)
+    return values[np.sort(first)].tolist()
+
+
 class Assembler:
 
-    def __init__(self, fig: plt.Figure, log: Log):
+    def __init__(self, fig: Figure, log: Log):
         self._log = log
         self._fig = fig
 
@@ -74,7 +88,7 @@ class Assembler:
         return self._lm
 
     @property
-    def ax(self) -> plt.Axes:
+    def ax(self) -> Axes:
         return self.am.ax
 
     @property
@@ -94,7 +108,72 @@ class Assembler:
 
     @data.setter
     def data(self, value):
-        self._data = Data(value, self._log)
+        if isinstance(value, Data):
+            self._data = value
+        else:
+            self._data = Data(value, self._log)
+
+    def update(self, start: int):
+        """
+        Draws only the elements from index 'start' onward (e.g. after
+        appending new data) and refreshes the axis and extra decorations
+        """
+        self._draw_elements(start)
+        self._draw_axis()
+        self.em.clear()
+        self._draw_extra()
+
+    def _draw_shapes(self, locations, values, positions, mask, colors,
+                     labels, fit=(True, True), show_missing=False) -> list:
+        """
+        Draws elements at given locations and queues their value labels.
+        If 'use_collection' is set in the ObjectManager, all of them are
+        drawn as a single collection. Missing elements are drawn (with
+        missing options) only if 'show_missing' is set. Returns the added
+        artists
+        """
+        x, y = np.asarray(locations, dtype=float).reshape(-1, 2).T
+        if self.am.orientation == "y":
+            x, y = y, x
+
+        if not self.om.use_collection:
+            self.om.add_bounds(*self.om.element_bounds(x, y, values))
+            shapes = [self.om.get(*e) for e in zip(x, y, values, positions,
+                                                   mask, colors)]
+            artists = [self.ax.add_patch(s.get()) for s, m in
+                       zip(shapes, mask) if show_missing or not m]
+            self._queue_values(shapes, labels, colors, fit)
+            return artists
+
+        artists = [self.ax.add_collection(self.om.get_collection(
+            x, y, values, colors, visible=~mask))]
+        if show_missing and mask.any():
+            artists.append(self.ax.add_collection(self.om.get_collection(
+                x[mask], y[mask], values[mask], colors[mask],
+                self.om.missing_options)))
+        width, height = self.om.sizes(values)
+        self.em.queue_values(x, y, width, height, labels, colors, fit)
+        return artists
+
+    def _queue_values(self, shapes: list, values, colors, fit=(True, True)):
+        """
+        Value labels of the given shapes, see ExtraManager.queue_values
+        """
+        if not self.em.show_values:
+            return
+        bounds = np.array([(s.x, s.y, s.width, s.height) for s in shapes],
+                          dtype=float).reshape(-1, 4)
+        self.em.queue_values(*bounds.T, values, colors, fit)
+
+    def _draw_missing_regions(self, locations, start=0):
+        """
+        Counts missing values and marks their locations on the major axis
+        """
+        mask = self.data.mask[start:]
+        self.om.count_missing(mask)
+        if self.om.show_missing and mask.any():
+            starts = np.asarray(locations[start:], dtype=float)[mask, 0]
+            self.am.major.add_missing_regions(starts, self.om.width)
 
     def _set_auto_limit(self):
 
@@ -116,9 +195,9 @@ class Assembler:
         self._log.info("Axis limit is set automatically")
 
     def _check_axis_transformations(self):
-        if self.am.x.is_inverted:
+        if self.am.x.is_inverted and not self.ax.xaxis_inverted():
             self.ax.invert_xaxis()
-        if self.am.y.is_inverted:
+        if self.am.y.is_inverted and not self.ax.yaxis_inverted():
             self.ax.invert_yaxis()
 
         if self.am.x.scale is not None:
@@ -126,21 +205,61 @@ class Assembler:
         if self.am.y.scale is not None:
             self.ax.set_yscale(self.am.y.scale)
 
+    def _thinned_ticks(self, axis: Axis, horizontal: bool) -> tuple:
+        """
+        Every n-th tick and its label such that the labels do not overlap
+        in the available pixels. User defined ticks are kept as they are
+        """
+        ticks, labels = axis.ticks, axis.tick_labels
+        if (not axis.thin_ticks or not axis.is_auto_ticks or len(ticks) < 3
+                or len(labels) != len(ticks)):
+            return ticks, labels
+        options = {"fontsize": matplotlib.rcParams[
+            "{}tick.labelsize".format("x" if horizontal else "y")],
+            **axis.ticklabels_options}
+        widths, height = label_size([str(x) for x in labels], options,
+                                    self.ax.figure.dpi)
+        rotation = options.get("rotation", 0)
+        rotation = {"horizontal": 0, "vertical": 90}.get(rotation, rotation)
+        cos = abs(np.cos(np.deg2rad(float(rotation))))
+        sin = abs(np.sin(np.deg2rad(float(rotation))))
+        width = widths.max()
+        if horizontal:
+            extent = width * cos + height * sin
+            pixels = self.ax.bbox.width / abs(np.diff(self.ax.get_xlim())[0])
+        else:
+            extent = width * sin + height * cos
+            pixels = self.ax.bbox.height / abs(np.diff(self.ax.get_ylim())[0])
+        # Half of the font size is kept as a space between labels
+        extent += height / 2
+        spacing = np.median(np.abs(np.diff(ticks))) * pixels
+        if spacing <= 0 or extent <= spacing:
+            return ticks, labels
+        step = int(np.ceil(extent / spacing))
+        self._log.info("Only every {} tick of {} axis is shown as all ticks "
+                       "can not fit".format(step, axis.name))
+        return ticks[::step], labels[::step]
+
     def _draw_axis(self):
         self._set_auto_limit()
+        if self.am.aspect_ratio is not None:
+            self.ax.set_aspect(self.am.aspect_ratio)
+        # Aspect ratio changes the size of the axis
+        self.ax.apply_aspect()
+
         if len(self.am.x.ticks) != 0:
-            self.ax.set_xticks(self.am.x.ticks, **self.am.x.tick_options)
-            self.ax.set_xticklabels(self.am.x.tick_labels,
-                                    **self.am.x.ticklabels_options)
+            ticks, labels = self._thinned_ticks(self.am.x, True)
+            self.ax.set_xticks(ticks, **self.am.x.tick_options)
+            self.ax.set_xticklabels(labels, **self.am.x.ticklabels_options)
         if self.am.x.tick_direction == "top":
             self.ax.xaxis.tick_top()
         elif self.am.x.tick_direction == "bottom":
             self.ax.xaxis.tick_bottom()
 
         if len(self.am.y.ticks) != 0:
-            self.ax.set_yticks(self.am.y.ticks, **self.am.y.tick_options)
-            self.ax.set_yticklabels(self.am.y.tick_labels,
-                                    **self.am.y.ticklabels_options)
+            ticks, labels = self._thinned_ticks(self.am.y, False)
+            self.ax.set_yticks(ticks, **self.am.y.tick_options)
+            self.ax.set_yticklabels(labels, **self.am.y.ticklabels_options)
 
         if self.am.y.tick_direction == "left":
             self.ax.yaxis.tick_left()
@@ -153,9 +272,6 @@ class Assembler:
         self.ax.spines['top'].set_visible(top)
         self.ax.spines['bottom'].set_visible(bottom)
 
-        if self.am.aspect_ratio is not None:
-            self.ax.set_aspect(self.am.aspect_ratio)
-
         if not self.am.x.show_ticks:
             self.ax.set_xticks([])
         if not self.am.y.show_ticks:
@@ -174,6 +290,7 @@ class Assembler:
 
         self.em.draw_midlines()
         self.em.draw_edgelines()
+        self.em.draw_values()
         self.em.draw_colorbar(self.data)
         self.em.draw_legends()
         self.em.draw_grid()
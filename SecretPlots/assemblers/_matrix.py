@@ -10,13 +10,24 @@
 #
 #  Matrix Assemblers
 
-from SecretPlots.assemblers import Assembler
+import numpy as np
+
+from SecretPlots.assemblers._base import Assembler, unique_ticks
 from SecretPlots.constants import *
 from SecretPlots.managers import ColorMapLocations
+from SecretPlots.objects import Data
+from SecretPlots.objects.shapes import shape_name
 
 
 class ColorMapAssembler(Assembler):
 
+    def __init__(self, fig, log):
+        super().__init__(fig, log)
+        self._max_value = None
+        self._mesh = None
+        # Artists of the cells, removed when all cells are drawn again
+        self._cells = []
+
     @property
     def main_location_manager(self):
         return ColorMapLocations(self.am, self.om, self._log)
@@ -39,52 +50,180 @@ class ColorMapAssembler(Assembler):
         else:
             self.em.show_legends = True
 
-    def _draw_elements(self):
-        locations = self.lm.get(self.data)
-        for loc, val, pos in zip(locations, self.data.value,
-                                 self.data.positions):
-            x, y = loc
-            if self.am.orientation == "y":
-                x, y = y, x
-
-            if self.type == PLOT_BOOLEAN_PLOT:
-                if self.data.threshold is None:
-                    self._log.error("For BooleanPlot, you should specify "
-                                    "threshold")
-                v = 1 if val >= self.data.threshold else 0
-                shape = self.om.get(x, y, v, pos)
-            else:
-                shape = self.om.get(x, y, val / self.data.max, pos)
-
-            self.ax.add_patch(shape.get())
-            self.em.draw_values(shape, val,
-                                self.cm.color(pos, val / self.data.max))
-
+    def _can_raster(self) -> bool:
+        """
+        Cells can be drawn as a single QuadMesh only when they are plain
+        rectangles on a regular grid without any gaps between them. Mesh
+        needs the entire matrix in memory, hence memory-mapped data is
+        always drawn block by block
+        """
+        possible = (self.data.type != Data.COMPLEX_CATEGORICAL
+                    and not self.data.is_memmap
+                    and shape_name(self.om.shape) == "rectangle"
+                    and self.om.rotation == 0
+                    and self.am.major.gap == 0
+                    and self.am.minor.gap == 0
+                    and self.om.options == self.om.collection_options
+                    and (self.am.orientation != "y"
+                         or self.om.width == self.om.height))
+        if self.om.use_raster and not possible:
+            self._log.warn("Raster rendering is not possible with current "
+                           "settings. Cells will be drawn individually")
+        if self.om.use_raster is None:
+            return possible
+        return possible and self.om.use_raster
+
+    def _normalized(self, values, mask):
+        """
+        Values of the cells as they are used for the colors
+        """
+        if self.type == PLOT_BOOLEAN_PLOT:
+            if self.data.threshold is None:
+                self._log.error("For BooleanPlot, you should specify "
+                                "threshold")
+            # Missing values are shown as OFF
+            with np.errstate(invalid="ignore"):
+                on = np.asarray(values) >= self.data.threshold
+            return (on & ~mask).astype(int)
+        return np.where(mask, np.nan, values) / self._max_value
+
+    @staticmethod
+    def _labels(values, mask):
+        if mask.any():
+            return np.where(mask, np.nan, values)
+        return values
+
+    def _draw_cells(self, start=0):
         ticks_major = []
         ticks_minor = []
-        edge_major = []
-        edge_minor = []
-        for i, m in enumerate(locations):
-            if i == 0:
-                edge_major.append(m[0])
-                edge_minor.append(m[1])
-            elif i == len(locations) - 1:
-                edge_major.append(m[0] + self.om.width)
-                edge_minor.append(m[1] + self.om.height)
-            temp = round(m[0] + self.om.width / 2, 2)
-            temp_minor = round(m[1] + self.om.height / 2, 2)
-            if temp not in ticks_major:
-                ticks_major.append(temp)
-            if temp_minor not in ticks_minor:
-                ticks_minor.append(temp_minor)
-
-        self.am.major.make_ticks(ticks_major)
-        self.am.minor.make_ticks(ticks_minor)
+        first = None
+        last = None
+        count = 0
+        for locations, values, positions, mask in self.lm.blocks(self.data):
+            skip = max(0, start - count)
+            self.om.count_missing(mask[skip:])
+            normalized = self._normalized(values[skip:], mask[skip:])
+            colors = self.cm.colors(positions[skip:], normalized)
+            missing = mask[skip:]
+            if self.type == PLOT_BOOLEAN_PLOT:
+                # Missing values are shown as OFF
+                missing = np.zeros_like(missing)
+            self._cells.extend(self._draw_shapes(
+                locations[skip:], normalized, positions[skip:], missing,
+                colors, self._labels(values[skip:], mask[skip:]),
+                show_missing=True))
+
+            if len(locations) == 0:
+                continue
+            # Ticks of each block are unique already, only the ticks
+            # repeated across the blocks are removed at the end
+            ticks_major.extend(unique_ticks(locations[:, 0] +
+                                            self.om.width / 2))
+            ticks_minor.extend(unique_ticks(locations[:, 1] +
+                                            self.om.height / 2))
+            if first is None:
+                first = locations[0]
+            last = locations[-1]
+            count += len(locations)
+
+        edge_major = [first[0]] if count > 0 else []
+        edge_minor = [first[1]] if count > 0 else []
+        if count > 1:
+            edge_major.append(last[0] + self.om.width)
+            edge_minor.append(last[1] + self.om.height)
+
+        self.am.major.make_ticks(unique_ticks(ticks_major))
+        self.am.minor.make_ticks(unique_ticks(ticks_minor))
         self.am.major.edgelines = edge_major
         self.am.minor.edgelines = edge_minor
 
-        self.am.major.make_labels()
-        self.am.minor.make_labels()
+    def _draw_raster(self, start=0):
+        """
+        Draws all cells as a single QuadMesh. Missing cells are left empty
+        in the mesh and only they (and the value labels, if shown) are
+        drawn individually
+        """
+        if self._mesh is not None:
+            self._mesh.remove()
+        rows, cols = self.data.grid_shape
+        major = self.lm.major + np.arange(rows + 1) * self.om.width
+        minor = self.lm.minor + np.arange(cols + 1) * self.om.height
+        mask = self.data.mask
+        values = self.data.value.reshape(rows, cols)
+
+        if self.type == PLOT_BOOLEAN_PLOT:
+            values = self._normalized(values, mask.reshape(rows, cols))
+            self.cm.add_boolean_colors()
+            options = {"cmap": self.cm.boolean_cmap, "vmin": 0, "vmax": 1}
+        else:
+            values = np.ma.masked_array(values, mask.reshape(rows, cols))
+            options = {"cmap": self.cm.cmap, "vmin": 0,
+                       "vmax": self._max_value}
+
+        if self.am.orientation == "y":
+            x, y = minor, major
+        else:
+            x, y, values = major, minor, values.T
+        self._mesh = self.ax.pcolormesh(x, y, values, **options,
+                                        **self.om.collection_options)
+        self.om.add_bounds(x[0], y[0], x[-1], y[-1])
+        self.om.count_missing(mask[start:])
+
+        if self.type != PLOT_BOOLEAN_PLOT and mask[start:].any():
+            positions = self.data.positions[start:][mask[start:]]
+            x = self.lm.major + positions[:, 0] * self.om.width
+            y = self.lm.minor + positions[:, 1] * self.om.height
+            if self.am.orientation == "y":
+                x, y = y, x
+            nan = np.full(len(positions), np.nan)
+            self._cells.append(self.ax.add_collection(self.om.get_collection(
+                x, y, nan, self.cm.colors(positions, nan),
+                self.om.missing_options)))
+
+        if self.em.show_values:
+            positions = self.data.positions[start:]
+            value = self.data.value[start:]
+            x = self.lm.major + positions[:, 0] * self.om.width
+            y = self.lm.minor + positions[:, 1] * self.om.height
+            if self.am.orientation == "y":
+                x, y = y, x
+            colors = self.cm.colors(positions,
+                                    self._normalized(value, mask[start:]))
+            self.em.queue_values(x, y, self.om.width, self.om.height,
+                                 self._labels(value, mask[start:]), colors)
+
+        self.am.major.make_ticks(unique_ticks(major[:-1] + self.om.width / 2))
+        self.am.minor.make_ticks(unique_ticks(minor[:-1] +
+                                              self.om.height / 2))
+        if len(mask) > 1:
+            self.am.major.edgelines = [major[0], major[-1]]
+            self.am.minor.edgelines = [minor[0], minor[-1]]
+        else:
+            self.am.major.edgelines = [major[0]]
+            self.am.minor.edgelines = [minor[0]]
+
+    def _draw_elements(self, start=0):
+        self._max_value = self.data.max
+        if self._can_raster():
+            self._draw_raster(start)
+        else:
+            self._draw_cells(start)
+
+        self.am.major.make_labels(self.data.row_labels)
+        self.am.minor.make_labels(self.data.column_labels)
+
+    def update(self, start: int):
+        # Appended values can only raise the maximum. Comparing with '>'
+        # keeps it False when either maximum is NaN (all values missing)
+        if self.data.max > self._max_value:
+            # Normalisation is changed, hence all cells are drawn again
+            for a in self._cells:
+                a.remove()
+            self._cells = []
+            self.em.clear_values()
+            self.om.no_of_missing = 0
+            start = 0
+        super().update(start)
 
     def draw(self):
         self._adjust_defaults()
@@ -19,23 +19,42 @@
 #
 # Main graph class
 
-import matplotlib.pyplot as plt
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
 
 from SecretPlots.assemblers import Assembler
-from SecretPlots.utils import Log
-
-
-class SecretPlot:
-    def __init__(self, data, fig: plt.Figure = None, log: Log = None):
-        if fig is None:
-            fig = plt.figure()
-        self.fig = fig
+from SecretPlots.managers import FigurePool
+from SecretPlots.objects import Data
+from SecretPlots.utils import (Log, ClosablePlot, new_figure, show_figure,
+                               close_figure)
+
+
+class SecretPlot(ClosablePlot):
+    """
+    All drawing is done on the plot's own figure, hence plots can be drawn
+    on a bare matplotlib.figure.Figure (without any pyplot state), e.g. to
+    render them concurrently from different threads. If 'pool' is given
+    instead of 'fig', figure is taken from the FigurePool while drawing
+    and returned to it when the plot is closed. Set 'auto_close' (or pass
+    'close' to 'save') to return it right after saving
+    """
+
+    def __init__(self, data, fig: Figure = None, log: Log = None,
+                 dtype=None, pool: FigurePool = None):
+        if fig is None and pool is None:
+            fig = new_figure()
+        self._fig = fig
+        self.pool = pool if fig is None else None
         self._raw_data = data
+        self.dtype = dtype
         if log is None:
             log = Log()
         self._log = log
         self._assembler = None
         self._figure_drawn = False
+        self._closed = False
+        # Release the figure after it is saved
+        self.auto_close = False
 
         self.orientation = None
         self.x_gap = None
@@ -71,6 +90,8 @@ class SecretPlot:
         self.y_inverted = None
         self.on_color = None
         self.off_color = None
+        self.use_collection = None
+        self.use_raster = None
 
         self._log.info(
             "'{}' initialization complete ".format(self.assembler.type))
@@ -107,6 +128,10 @@ class SecretPlot:
             self.assembler.em.show_values = self.show_values
         if self.show_grid is not None:
             self.assembler.em.show_grid = self.show_grid
+        if self.use_collection is not None:
+            self.assembler.om.use_collection = self.use_collection
+        if self.use_raster is not None:
+            self.assembler.om.use_raster = self.use_raster
 
         if self.show_x_midlines is not None:
             self.assembler.am.x.show_midlines = self.show_x_midlines
@@ -163,35 +188,75 @@ class SecretPlot:
         return self.assembler.am.y
 
     @property
-    def ax(self) -> plt.Axes:
+    def ax(self) -> Axes:
         return self.assembler.am.ax
 
+    @property
+    def fig(self) -> Figure:
+        if self._fig is None and self._assembler is not None:
+            # Pooled figure, available only after the axes are generated
+            return self._assembler.gm.fig
+        return self._fig
+
+    def _make_assembler(self) -> Assembler:
+        self._check_open()
+        assembler = self.main_assembler
+        assembler.gm.pool = self.pool
+        return assembler
+
     @property
     def assembler(self):
         if self._assembler is None:
-            self._assembler = self.main_assembler
-            self._assembler.data = self._raw_data
+            self._assembler = self._make_assembler()
+            self._assembler.data = Data(self._raw_data, self._log,
+                                        dtype=self.dtype)
         return self._assembler
 
     def _assemble_components(self):
         self._check_settings()
         self.assembler.draw()
 
+    def _release(self):
+        if self.pool is None:
+            close_figure(self.fig)
+        elif self.fig is not None:
+            self.pool.release(self.fig)
+        self._assembler = None
+        self._raw_data = None
+
     def draw(self):
+        self._check_open()
         if self._figure_drawn:
             return
         self._assemble_components()
         self._figure_drawn = True
 
+    def append(self, data, labels=None):
+        """
+        Adds new data to the plot (see Data.append). If the plot is already
+        drawn, only the new elements are added to it
+        """
+        self._check_open()
+        start = self.assembler.data.append(data, labels)
+        if self._figure_drawn:
+            self.assembler.update(start)
+        return self
+
     def show(self, tight=False):
         self.draw()
         if tight:
-            plt.tight_layout()
-        plt.show()
-
-    def save(self, filename, **kwargs):
+            self.fig.tight_layout()
+        show_figure(self.fig, self._log)
+
+    def save(self, filename, close: bool = None, **kwargs):
+        """
+        :param close: Close the plot after saving, 'auto_close' is used if
+            not given
+        """
         self.draw()
-        plt.savefig(filename, **kwargs)
+        self.fig.savefig(filename, **kwargs)
+        if close or (close is None and self.auto_close):
+            self.close()
 
     def add_grid(self, **kwargs):
         self.show_grid = True
@@ -310,6 +375,14 @@ class SecretPlot:
         self.assembler.am.frame_visibility = (left, right, top, bottom)
         return self
 
+    def change_rendering(self, use_collection: bool = None,
+                         use_raster: bool = None):
+        if use_collection is not None:
+            self.use_collection = use_collection
+        if use_raster is not None:
+            self.use_raster = use_raster
+        return self
+
     def change_shape(self, value):
         self.shape = value
         return self
@@ -13,7 +13,8 @@ from SecretPlots.assemblers import (Assembler,
                                     BarAssembler,
                                     BooleanAssembler,
                                     BarGroupedAssembler,
-                                    ColorMapAssembler)
+                                    ColorMapAssembler,
+                                    HistAssembler)
 from SecretPlots.graphs._graphs import SecretPlot
 
 
@@ -21,32 +22,95 @@ class BarPlot(SecretPlot):
 
     @property
     def main_assembler(self) -> Assembler:
-        return BarAssembler(self.fig, self._log)
+        return BarAssembler(self._fig, self._log)
 
 
 class BarGroupedPlot(SecretPlot):
 
     @property
     def main_assembler(self) -> Assembler:
-        return BarGroupedAssembler(self.fig, self._log)
+        return BarGroupedAssembler(self._fig, self._log)
 
 
 class ColorPlot(SecretPlot):
 
     @property
     def main_assembler(self) -> Assembler:
-        return ColorMapAssembler(self.fig, self._log)
+        return ColorMapAssembler(self._fig, self._log)
 
 
 class BooleanPlot(SecretPlot):
 
-    def __init__(self, data, threshold):
-        super().__init__(data)
+    def __init__(self, data, threshold, dtype=None, fig=None, log=None,
+                 pool=None):
+        super().__init__(data, fig=fig, log=log, dtype=dtype, pool=pool)
         self.assembler.data.threshold = threshold
 
     @property
     def main_assembler(self) -> Assembler:
-        return BooleanAssembler(self.fig, self._log)
+        return BooleanAssembler(self._fig, self._log)
+
+
+class HistPlot(SecretPlot):
+    """
+    Histogram of the values. Data can be an array (including memory-mapped
+    arrays), or an iterable / generator of chunks. Values are binned chunk
+    by chunk and only the counts are kept. More values can be added later
+    with 'append'.
+
+    :param bins: Number of bins, numpy bin estimator name or bin edges
+    :param bin_range: (min, max) of the bins. Needed when data is streamed
+        and later chunks can go beyond the values of the first chunk
+    :param density: If True, bins show probability density
+    """
+
+    def __init__(self, data, bins=None, bin_range=None, density=False,
+                 fig=None, log=None, pool=None):
+        self.bins = bins
+        self.bin_range = bin_range
+        self.density = density
+        super().__init__(data, fig=fig, log=log, pool=pool)
+
+    @property
+    def main_assembler(self) -> Assembler:
+        return HistAssembler(self._fig, self._log)
+
+    @property
+    def assembler(self) -> HistAssembler:
+        if self._assembler is None:
+            self._assembler = self._make_assembler()
+            if self.bins is not None:
+                self._assembler.lm.bins = self.bins
+            if self.bin_range is not None:
+                self._assembler.lm.hist_options(range=self.bin_range)
+            if self.density:
+                self._assembler.lm.hist_options(density=True)
+            self._assembler.add(self._raw_data)
+            # Only counts are needed from now on
+            self._raw_data = None
+        return self._assembler
+
+    @property
+    def edges(self):
+        return self.assembler.lm.edges
+
+    @property
+    def counts(self):
+        return self.assembler.lm.counts
+
+    def append(self, data, labels=None):
+        """
+        Bins new values into the existing bins and redraws them if the plot
+        is already drawn. Bins are labelled by their edges, hence 'labels'
+        are not supported
+        """
+        self._check_open()
+        if labels is not None:
+            self._log.error("Labels can not be appended to a histogram")
+        self.assembler.add(data)
+        if self._figure_drawn:
+            self.assembler.update(0)
+        return self
 
 
 def run():
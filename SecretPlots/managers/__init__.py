@@ -11,7 +11,7 @@
 from SecretPlots.managers._axis import AxisManager
 from SecretPlots.managers._color import ColorManager
 from SecretPlots.managers._extra import ExtraManager
-from SecretPlots.managers._grid import GridManager
+from SecretPlots.managers._grid import GridManager, FigurePool
 from SecretPlots.managers._object import ObjectManager
 
 from SecretPlots.managers.location import *
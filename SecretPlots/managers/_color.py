@@ -10,11 +10,15 @@
 # Color Manager
 
 import matplotlib
+import numpy as np
+from matplotlib.colors import to_hex, to_rgba, to_rgba_array
 from SecretColors import Palette, ColorMap
 from SecretColors.utils import rgb_to_hex
 
 from SecretPlots.constants import *
-from SecretPlots.utils import Log
+from SecretPlots.utils import Log, color_cache, get_palette
+
+DEFAULT_CMAP = "SecretPlots.default"
 
 
 class ColorManager:
@@ -25,6 +29,8 @@ class ColorManager:
         self._unique_colors = []
         self._all_colors = {}
         self._cmap = None
+        self._cmap_source = None
+        self._cmap_key = None
         self._on_color = None
         self._off_color = None
         self.user_colors = None
@@ -56,25 +62,84 @@ class ColorManager:
     @property
     def palette(self) -> Palette:
         if self._palette is None:
-            self._palette = Palette(show_warning=False)
+            self._palette = get_palette()
         return self._palette
 
     @property
     def all_colors(self):
         return self._all_colors
 
+    def _default_cmap(self):
+        colors = [self.palette.lime(shade=30), self.palette.lime(),
+                  self.palette.brown(shade=40),
+                  self.palette.brown(shade=80),
+                  self.palette.black()]
+        return ColorMap(matplotlib, self.palette).from_list(colors)
+
     @property
     def cmap(self):
-        if self.user_cmap is not None:
-            self._cmap = matplotlib.cm.get_cmap(self.user_cmap)
+        if self.user_cmap is not None and self.user_cmap is not \
+                self._cmap_source:
+            if isinstance(self.user_cmap, str):
+                # Named colormaps are shared between the plots
+                name = self.user_cmap
+                self._cmap_key = name
+                self._cmap = color_cache.get(
+                    ("cmap", name), lambda: matplotlib.cm.get_cmap(name))
+            else:
+                self._cmap_key = None
+                self._cmap = matplotlib.cm.get_cmap(self.user_cmap)
+            self._cmap_source = self.user_cmap
         if self._cmap is None:
-            colors = [self.palette.lime(shade=30), self.palette.lime(),
-                      self.palette.brown(shade=40),
-                      self.palette.brown(shade=80),
-                      self.palette.black()]
-            self._cmap = ColorMap(matplotlib, self.palette).from_list(colors)
+            self._cmap_key = DEFAULT_CMAP
+            self._cmap = color_cache.get(("cmap", DEFAULT_CMAP),
+                                         self._default_cmap)
         return self._cmap
 
+    @property
+    def lut(self):
+        """
+        RGBA lookup table with one entry per color of the colormap. It is
+        only available (and shared) for the named and default colormaps
+        """
+        cmap = self.cmap
+        if self._cmap_key is None:
+            return None
+        return color_cache.get(("lut", self._cmap_key, cmap.N),
+                               lambda: cmap(np.arange(cmap.N)))
+
+    def _map(self, values: np.ndarray) -> np.ndarray:
+        lut = self.lut
+        if lut is None:
+            return self.cmap(values)
+        # Same binning as matplotlib Colormap with default under/over colors
+        n = len(lut)
+        missing = np.isnan(values)
+        index = np.clip(np.where(missing, 0, values) * n, 0, n - 1)
+        colors = lut[index.astype(int)]
+        colors[missing] = self.cmap.get_bad()
+        return colors
+
+    @property
+    def boolean_cmap(self):
+        """
+        Two color map of OFF and ON colors, used when all cells of the
+        BooleanPlot are drawn at once. Legend entries are not registered
+        here, see 'add_boolean_colors'
+        """
+        colors = [self.off_color, self.on_color]
+        key = tuple(to_hex(x, keep_alpha=True) for x in colors)
+        return color_cache.get(
+            ("boolean", key),
+            lambda: matplotlib.colors.ListedColormap(colors))
+
+    def add_boolean_colors(self):
+        """
+        Registers ON and OFF colors for the legend
+        """
+        self._all_colors["ON"] = self.on_color
+        self._all_colors["OFF"] = self.off_color
+
     @staticmethod
     def cycle(color_list):
         while True:
@@ -102,11 +167,13 @@ class ColorManager:
         return rgb_to_hex(r, g, b)
 
     def color(self, position, value):
-        row, col = position
+        # Positions can be rows of Data.positions array, keep the color
+        # keys as plain int so that legends are not affected
+        row, col = int(position[0]), int(position[1])
         if self.plot_type == PLOT_BAR:
             if self.user_colors is not None:
                 if len(self.user_colors) > 1:
-                    return self._get_color(position[1])
+                    return self._get_color(col)
                 else:
                     return self._get_color(0)
             return self._get_color(row)
@@ -123,3 +190,42 @@ class ColorManager:
                 return self.on_color
         else:
             return self._get_color(row)
+
+    def _color_index(self, positions: np.ndarray) -> np.ndarray:
+        rows, cols = positions[:, 0], positions[:, 1]
+        if self.plot_type == PLOT_BAR:
+            if self.user_colors is not None:
+                if len(self.user_colors) > 1:
+                    return cols
+                else:
+                    return np.zeros_like(cols)
+            return rows
+        if self.plot_type in [PLOT_STACKED_BAR, PLOT_GROUPED_BAR]:
+            return cols
+        return rows
+
+    def colors(self, positions, values) -> np.ndarray:
+        """
+        RGBA colors of all the elements at once. Same as calling 'color'
+        for each position and value but returns (N, 4) float array
+        """
+        positions = np.asarray(positions, dtype=int).reshape(-1, 2)
+        values = np.asarray(values, dtype=float).reshape(-1)
+        if self.plot_type == PLOT_COLOR_MAP:
+            colors = self._map(values)
+            # Same as 'color', alpha from the colormap is not used
+            colors[:, 3] = 1
+            return colors
+        elif self.plot_type == PLOT_BOOLEAN_PLOT:
+            self.add_boolean_colors()
+            table = to_rgba_array([self.off_color, self.on_color])
+            return table[(values != 0).astype(int)]
+
+        # Colors are assigned in order of first appearance, same as 'color'
+        index = self._color_index(positions)
+        keys, first, inverse = np.unique(index, return_index=True,
+                                         return_inverse=True)
+        table = np.empty((len(keys), 4))
+        for k in np.argsort(first, kind="stable"):
+            table[k] = to_rgba(self._get_color(int(keys[k])))
+        return table[inverse.reshape(-1)]
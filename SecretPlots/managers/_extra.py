@@ -19,9 +19,11 @@
 #
 # Extra Manager
 
-import matplotlib
-import matplotlib.pyplot as plt
-from SecretColors.utils import text_color
+import numpy as np
+from matplotlib.cm import ScalarMappable
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.colors import Normalize
+from matplotlib.font_manager import FontProperties
 from matplotlib.patches import Patch
 
 from SecretPlots.managers._axis import AxisManager
@@ -31,6 +33,25 @@ from SecretPlots.objects import Data
 from SecretPlots.utils import Log
 
 
+def contrast_colors(colors: np.ndarray) -> np.ndarray:
+    """
+    Black or white text colors for given (N, 4) RGBA backgrounds. Same
+    rule as SecretColors.utils.text_color
+    """
+    score = np.asarray(colors, dtype=float)[:, :3] @ [0.299, 0.587, 0.114]
+    return np.where(score > 0.729, "#000000", "#ffffff")
+
+
+def label_size(texts, options: dict, dpi: float) -> tuple:
+    """
+    Approximate (widths, height) of rendered text labels in pixels
+    """
+    size = FontProperties(size=options.get("fontsize", options.get("size"))
+                          ).get_size_in_points()
+    lengths = np.array([len(t) for t in texts])
+    return lengths * size * 0.6 * dpi / 72, size * dpi / 72
+
+
 class ExtraManager:
     def __init__(self, gm: GridManager, am: AxisManager, cm: ColorManager,
                  log: Log):
@@ -44,6 +65,10 @@ class ExtraManager:
         self._value_options = None
         self._legends_options = None
         self._grid_options = None
+        # Decorations which should be removed before drawing them again
+        self._artists = []
+        # Value labels are drawn only after the axis limits are known
+        self._values = []
 
         self._log.info("ExtraManager is initialized with default values")
 
@@ -78,50 +103,143 @@ class ExtraManager:
     def add_grid_options(self, **kwargs):
         self._grid_options = {**self.grid_options, **kwargs}
 
-    def draw_values(self, shape, text, bg_color):
+    def queue_values(self, x, y, width, height, values, colors,
+                     fit=(True, True)):
+        """
+        Adds value labels of the elements with given bounds and colors.
+        They are drawn together with other decorations. 'fit' tells along
+        which axes the label should fit inside its element to be shown
+        """
         if not self.show_values:
             return
+        n = len(values)
+        x, y, width, height = [np.broadcast_to(np.asarray(v, dtype=float),
+                                               (n,))
+                               for v in (x, y, width, height)]
+        fit = np.tile(np.asarray(fit, dtype=bool), (n, 1))
+        self._values.append((x, y, width, height, np.asarray(values),
+                             np.asarray(colors, dtype=float).reshape(n, 4),
+                             fit))
+
+    def clear_values(self):
+        self._values = []
+
+    def _label_size(self, texts, opts) -> tuple:
+        return label_size(texts, opts, self.gm.get_main_axis().figure.dpi)
+
+    def draw_values(self):
+        if not self.show_values or len(self._values) == 0:
+            return
 
-        opts = {"ha": "center", "color": text_color(bg_color)}
-
-        opts = {**opts, **self.value_options}
-
-        if opts["relative"]:
-            x = shape.x + shape.width * opts["anchor"][0] + opts["offset"][0]
-            y = shape.y + shape.height * opts["anchor"][1] + opts["offset"][1]
+        x, y, width, height, values, colors, fit = [
+            np.concatenate(v) for v in zip(*self._values)]
+        opts = {"ha": "center", **self.value_options}
+        anchor = opts.pop("anchor")
+        offset = opts.pop("offset")
+        max_labels = opts.pop("max_labels", None)
+        if opts.pop("relative"):
+            x = x + width * anchor[0] + offset[0]
+            y = y + height * anchor[1] + offset[1]
         else:
-            x = shape.x + opts["anchor"][0] + opts["offset"][0]
-            y = shape.y + opts["anchor"][1] + opts["offset"][1]
-
-        if opts["anchor"][0] != 0.5 and opts["anchor"][1] != 0.5:
+            x = x + anchor[0] + offset[0]
+            y = y + anchor[1] + offset[1]
+        if anchor[0] != 0.5 and anchor[1] != 0.5:
             del opts["ha"]
 
-        del opts["anchor"]
-        del opts["relative"]
-        del opts["offset"]
-
-        self.gm.get_main_axis().text(x, y, "{}".format(text), **opts)
-        self._log.info("Values are shown in the plot")
+        texts = ["{}".format(v) for v in values]
+
+        # Labels which do not fit inside their elements are skipped
+        ax = self.gm.get_main_axis()
+        ax.apply_aspect()
+        scale = np.abs(ax.transData.transform([(1, 1)]) -
+                       ax.transData.transform([(0, 0)]))[0]
+        text_width, text_height = self._label_size(texts, opts)
+        keep = ~((fit[:, 0] & (text_width > np.abs(width) * scale[0])) |
+                 (fit[:, 1] & (text_height > np.abs(height) * scale[1])))
+        keep = np.flatnonzero(keep)
+        if max_labels is not None and len(keep) > max_labels:
+            keep = keep[np.linspace(0, len(keep) - 1,
+                                    max_labels).astype(int)]
+
+        # User defined color is used for all the labels
+        color = opts.pop("color", None)
+        text_colors = contrast_colors(colors)
+
+        for i in keep:
+            self._artists.append(ax.text(
+                x[i], y[i], texts[i],
+                color=text_colors[i] if color is None else color, **opts))
+        self._log.info("{} of {} values are shown in the plot".format(
+            len(keep), len(values)))
+
+    def _add_lines(self, values, axis: str, options: dict):
+        """
+        Adds lines spanning the whole axis at given values as a single
+        LineCollection (same as calling axvline/axhline for each value)
+        """
+        if values is None or len(values) == 0:
+            return
+        ax = self.am.ax
+        values = np.asarray(values, dtype=float)
+        points = np.stack([np.column_stack([values, np.zeros(len(values))]),
+                           np.column_stack([values, np.ones(len(values))])],
+                          axis=1)
+        if axis == "x":
+            transform = ax.get_xaxis_transform()
+        else:
+            points = points[:, :, ::-1]
+            transform = ax.get_yaxis_transform()
+        options = dict(options)
+        if "c" in options:
+            options["color"] = options.pop("c")
+        lines = LineCollection(points, transform=transform, **options)
+        ax.add_collection(lines, autolim=False)
+        self._artists.append(lines)
+
+    def _add_spans(self, regions, axis: str, options: dict):
+        """
+        Adds spans over the whole axis for given (start, end) regions as a
+        single PolyCollection (same as calling axvspan/axhspan for each)
+        """
+        if len(regions) == 0:
+            return
+        ax = self.am.ax
+        start, end = regions[:, 0], regions[:, 1]
+        zero, one = np.zeros(len(regions)), np.ones(len(regions))
+        points = np.stack([np.column_stack([start, zero]),
+                           np.column_stack([start, one]),
+                           np.column_stack([end, one]),
+                           np.column_stack([end, zero])], axis=1)
+        if axis == "x":
+            transform = ax.get_xaxis_transform()
+        else:
+            points = points[:, :, ::-1]
+            transform = ax.get_yaxis_transform()
+        options = dict(options)
+        # Patch options which are not available for the collections
+        if not options.pop("fill", True):
+            options.setdefault("facecolor", "none")
+        spans = PolyCollection(points, transform=transform, **options)
+        ax.add_collection(spans, autolim=False)
+        self._artists.append(spans)
 
     def draw_midlines(self):
         if self.am.x.show_midlines:
-            for x in self.am.x.midlines:
-                self.am.ax.axvline(x, **self.am.x.midlines_options)
-
+            self._add_lines(self.am.x.midlines, "x",
+                            self.am.x.midlines_options)
         if self.am.y.show_midlines:
-            for y in self.am.y.midlines:
-                self.am.ax.axhline(y, **self.am.y.midlines_options)
+            self._add_lines(self.am.y.midlines, "y",
+                            self.am.y.midlines_options)
 
         self._log.info("Midlines are added to the plot")
 
     def draw_edgelines(self):
         if self.am.x.show_edgelines:
-            for x in self.am.x.edgelines:
-                self.am.ax.axvline(x, **self.am.x.edgelines_options)
-
+            self._add_lines(self.am.x.edgelines, "x",
+                            self.am.x.edgelines_options)
         if self.am.y.show_edgelines:
-            for y in self.am.y.edgelines:
-                self.am.ax.axhline(y, **self.am.y.edgelines_options)
+            self._add_lines(self.am.y.edgelines, "y",
+                            self.am.y.edgelines_options)
 
         self._log.info("Edgelines are added the plot")
 
@@ -130,16 +248,18 @@ class ExtraManager:
         if not self.gm.has_colorbar:
             return
 
-        norm = matplotlib.colors.Normalize(vmin=data.min, vmax=data.max)
-        sm = plt.cm.ScalarMappable(cmap=self.cm.cmap, norm=norm)
+        norm = Normalize(vmin=data.min, vmax=data.max)
+        sm = ScalarMappable(cmap=self.cm.cmap, norm=norm)
 
         if self.gm.colorbar_location in ["right", "left", "r", "l"]:
             ori = "vertical"
         else:
             ori = "horizontal"
 
-        plt.colorbar(sm, cax=self.gm.get_colorbar_axis(),
-                     orientation=ori)
+        # Colorbar axis is cleared in case colorbar is drawn again
+        self.gm.get_colorbar_axis().cla()
+        self.gm.fig.colorbar(sm, cax=self.gm.get_colorbar_axis(),
+                             orientation=ori)
 
         if self.gm.colorbar_location in ["left", "l"]:
             self.gm.get_colorbar_axis().yaxis.set_ticks_position('left')
@@ -168,15 +288,24 @@ class ExtraManager:
             "handles": p
         }
         opts = {**opts, **self.legends_options}
-        plt.legend(**opts)
+        self.gm.get_main_axis().legend(**opts)
         self._log.info("Legends are added to the plot")
 
     def draw_grid(self):
         if not self.show_grid:
             return
-        plt.grid(**self.grid_options)
+        self.gm.get_main_axis().grid(**self.grid_options)
         self._log.info("Plot grid is generated")
 
     def draw_missing(self, **kwargs):
-        for x in self.am.x.missing_regions:
-            plt.axvspan(x[0], x[1], **kwargs)
+        self._add_spans(self.am.x.merged_missing_regions(), "x", kwargs)
+        self._add_spans(self.am.y.merged_missing_regions(), "y", kwargs)
+
+    def clear(self):
+        """
+        Removes midlines, edgelines, missing regions and value labels drawn
+        earlier
+        """
+        for a in self._artists:
+            a.remove()
+        self._artists = []
@@ -10,14 +10,204 @@
 #
 # Grid Manager
 
-import matplotlib.pyplot as plt
+import threading
+
+import matplotlib
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
 from matplotlib.gridspec import GridSpec
+from matplotlib.transforms import Bbox
 
 from SecretPlots.utils import Log
 
+COLORBAR_LOCATIONS = {
+    "right": "right", "r": "right",
+    "left": "left", "l": "left",
+    "top": "top", "t": "top",
+    "bottom": "bottom", "b": "bottom"
+}
+
+
+def default_grid(fig: Figure) -> GridSpec:
+    return GridSpec(3, 3,
+                    width_ratios=[1, 15, 1],
+                    height_ratios=[1, 15, 1],
+                    figure=fig)
+
+
+def add_layout(fig: Figure, location: str = None,
+               grid: GridSpec = None) -> tuple:
+    """
+    Adds the main axis and (if location is given) the colorbar axis to the
+    figure.
+
+    :param fig: Figure
+    :param location: Location of the colorbar (see COLORBAR_LOCATIONS)
+    :param grid: GridSpec for the colorbar layouts
+    :return: (main axis, colorbar axis or None)
+    """
+    if location is None:
+        return fig.add_subplot(111), None
+    if grid is None:
+        grid = default_grid(fig)
+    location = COLORBAR_LOCATIONS[location]
+    if location == "right":
+        main, cb = grid[:, :-1], grid[:, -1]
+    elif location == "left":
+        main, cb = grid[:, 1:], grid[:, 0]
+    elif location == "top":
+        main, cb = grid[1:, :], grid[0, :]
+    else:
+        main, cb = grid[:-1, :], grid[-1, :]
+    return fig.add_subplot(main), fig.add_subplot(cb)
+
+
+def reset_axes(ax: Axes):
+    """
+    Removes everything drawn on the axes and resets the axis settings
+    changed while drawing the plots. Much faster than Axes.cla
+    """
+    artists = (list(ax.collections) + list(ax.patches) + list(ax.lines) +
+               list(ax.texts) + list(ax.images) + list(ax.artists) +
+               list(ax.tables))
+    for artist in artists:
+        artist.remove()
+    if ax.legend_ is not None:
+        ax.legend_.remove()
+
+    rc = matplotlib.rcParams
+    for axis, sides in ((ax.xaxis, ("bottom", "top")),
+                        (ax.yaxis, ("left", "right"))):
+        # Resets label, scale, locators, formatters, ticks and grid
+        axis.clear()
+        name = axis.axis_name
+        params = {}
+        for side in sides:
+            params[side] = rc["{}tick.{}".format(name, side)]
+            params["label" + side] = rc["{}tick.label{}".format(name, side)]
+        axis.set_tick_params(which="both", **params)
+
+    for spine in ax.spines.values():
+        spine.set_visible(True)
+    ax.set_aspect("auto")
+    ax.set_autoscale_on(True)
+    ax.dataLim.set_points(Bbox.null().get_points())
+    ax.ignore_existing_data_limits = True
+
+
+class FigurePool:
+    """
+    Reusable figures of same size with their axes already laid out (with
+    or without colorbar axis). Plots which are given a pool take a figure
+    from it while drawing and return it when closed (see SecretPlot.close).
+    Returned figures are cleared with 'reset_axes' instead of being
+    created again.
+
+    :param max_size: Maximum number of idle figures kept in the pool
+    :param figsize: Size of the figures (inches)
+    :param dpi: DPI of the figures
+    """
+
+    def __init__(self, max_size: int = 8, figsize: tuple = None,
+                 dpi: float = None):
+        self.max_size = max_size
+        self.figsize = figsize
+        self.dpi = dpi
+        self._idle = {}
+        self._in_use = {}
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+        self.discarded = 0
+
+    def _create(self, layout):
+        fig = Figure(figsize=self.figsize, dpi=self.dpi)
+        main, cb = add_layout(fig, layout)
+        axes = [x for x in (main, cb) if x is not None]
+        # Positions are restored in case the layout is changed while drawing
+        positions = [x.get_position(original=True) for x in axes]
+        with self._lock:
+            self.created += 1
+        return fig, main, cb, positions
+
+    def prefill(self, count: int, location: str = None):
+        """
+        Creates idle figures in advance
+        """
+        layout = None if location is None else COLORBAR_LOCATIONS[location]
+        entries = [self._create(layout) for _ in range(count)]
+        with self._lock:
+            idle = self._idle.setdefault(layout, [])
+            idle.extend(entries[:max(0, self.max_size - self.size)])
+
+    def acquire(self, location: str = None) -> tuple:
+        """
+        :param location: Colorbar location or None if there is no colorbar
+        :return: (figure, main axis, colorbar axis or None)
+        """
+        layout = None if location is None else COLORBAR_LOCATIONS[location]
+        entry = None
+        with self._lock:
+            idle = self._idle.get(layout)
+            if idle:
+                entry = idle.pop()
+                self.reused += 1
+        if entry is None:
+            entry = self._create(layout)
+        with self._lock:
+            self._in_use[id(entry[0])] = (layout, entry)
+        return entry[:3]
+
+    def release(self, fig: Figure):
+        """
+        Clears the figure and returns it to the pool
+        """
+        with self._lock:
+            layout, entry = self._in_use.pop(id(fig), (None, None))
+        if entry is None:
+            return
+        fig, main, cb, positions = entry
+        for artist in (list(fig.texts) + list(fig.legends) +
+                       list(fig.images)):
+            artist.remove()
+        for ax, position in zip([x for x in (main, cb) if x is not None],
+                                positions):
+            reset_axes(ax)
+            ax.set_position(position)
+        with self._lock:
+            self.released += 1
+            if self.size < self.max_size:
+                self._idle.setdefault(layout, []).append(entry)
+                return
+            self.discarded += 1
+        fig.clear()
+
+    def clear(self):
+        """
+        Removes all idle figures
+        """
+        with self._lock:
+            self._idle = {}
+
+    @property
+    def size(self) -> int:
+        return sum(len(x) for x in self._idle.values())
+
+    @property
+    def in_use(self) -> int:
+        return len(self._in_use)
+
+    @property
+    def info(self) -> dict:
+        return {"size": self.size, "max_size": self.max_size,
+                "in_use": self.in_use, "created": self.created,
+                "reused": self.reused, "released": self.released,
+                "discarded": self.discarded}
+
 
 class GridManager:
-    def __init__(self, fig: plt.Figure, log: Log):
+    def __init__(self, fig: Figure, log: Log):
         self.fig = fig
         self._log = log
         self._log.info("GridManager is initialized with default values")
@@ -26,6 +216,8 @@ class GridManager:
         self.has_colorbar = None
         self._cb_location = None
         self._ax_grid = None
+        # Figure and axes are taken from the pool if 'fig' is not given
+        self.pool = None  # type: FigurePool
 
     @property
     def colorbar_location(self):
@@ -42,44 +234,44 @@ class GridManager:
         if self._ax_grid is None:
             self._log.info("Default GridSpec with 3 rows and 3 columns is "
                            "generated")
-            self._ax_grid = GridSpec(3, 3,
-                                     width_ratios=[1, 15, 1],
-                                     height_ratios=[1, 15, 1],
-                                     figure=self.fig)
+            self._ax_grid = default_grid(self.fig)
         return self._ax_grid
 
+    @ax_grid.setter
+    def ax_grid(self, value):
+        self._ax_grid = value
+
     def _generate_axes(self):
-        if not self.has_colorbar:
-            self._main = self.fig.add_subplot(111)
+        location = None
+        if self.has_colorbar:
+            location = self.colorbar_location
+            if location not in COLORBAR_LOCATIONS:
+                self._log.error("No such colorbar location found : "
+                                "{}".format(location))
+
+        if self.fig is None and self.pool is not None:
+            if self._ax_grid is not None:
+                # Pooled figures come with their own layout
+                self._log.error("Custom GridSpec can not be used with the "
+                                "figure pool")
+            self.fig, self._main, self._cb = self.pool.acquire(location)
+            self._log.info("Plot Grid is taken from the figure pool")
+            return
+
+        if location is None:
+            self._main, self._cb = add_layout(self.fig)
             self._log.info("Plot Grid is set to normal.")
             return
 
-        if self._cb_location in ["right", "r"]:
-            main = self.ax_grid[:, :-1]
-            cb = self.ax_grid[:, -1]
-        elif self._cb_location in ["left", "l"]:
-            main = self.ax_grid[:, 1:]
-            cb = self.ax_grid[:, 0]
-        elif self._cb_location in ["top", "t"]:
-            main = self.ax_grid[1:, :]
-            cb = self.ax_grid[0, :]
-        elif self._cb_location in ["bottom", "b"]:
-            main = self.ax_grid[:-1, :]
-            cb = self.ax_grid[-1, :]
-        else:
-            self._log.error("No such colorbar location found : {}".format(
-                self._cb_location))
-
-        self._main = self.fig.add_subplot(main)
-        self._cb = self.fig.add_subplot(cb)
+        self._main, self._cb = add_layout(self.fig, location, self.ax_grid)
         self._log.info("Plot Grid is set according to colorbar location")
 
-    def get_main_axis(self) -> plt.Axes:
+    def get_main_axis(self) -> Axes:
         if self._main is None:
             self._generate_axes()
         return self._main
 
-    def get_colorbar_axis(self) -> plt.Axes:
+    def get_colorbar_axis(self) -> Axes:
         if self._main is None:
             self._generate_axes()
         return self._cb
@@ -15,6 +15,7 @@ from SecretPlots.constants import *
 from SecretPlots.managers._axis import AxisManager
 from SecretPlots.managers._color import ColorManager
 from SecretPlots.objects import Element
+from SecretPlots.objects.shapes import shape_collection
 from SecretPlots.utils import Log
 
 
@@ -35,6 +36,10 @@ class ObjectManager:
         self.min_x = 0
         self.min_y = 0
         self.show_missing = True
+        # Draw all elements as a single PatchCollection
+        self.use_collection = True
+        # Draw matrix cells as a single QuadMesh. None: decide automatically
+        self.use_raster = None
         self._no_of_missing = 0
         self._log.info("ObjectManager is initialized with default values")
 
@@ -54,31 +59,115 @@ class ObjectManager:
             }
         return self._missing_options
 
+    @staticmethod
+    def shared_options(options: dict) -> dict:
+        """
+        Options which are not taken from the individual patches when they
+        are combined in a PatchCollection
+        """
+        per_patch = ["color", "c", "facecolor", "fc", "edgecolor", "ec",
+                     "linewidth", "lw", "linestyle", "ls", "antialiased",
+                     "aa", "alpha", "fill"]
+        return {k: v for k, v in options.items() if k not in per_patch}
+
+    @property
+    def collection_options(self):
+        return self.shared_options(self.options)
+
     def add_options(self, **kwargs):
         self._options = {**self.options, **kwargs}
 
     def add_missing_options(self, **kwargs):
         self._missing_options = {**self.missing_options, **kwargs}
 
-    def _check_limits(self, x, y):
-        if x > self.max_x:
-            self.max_x = x
-        elif x < self.min_x:
-            self.min_x = x
-        if y > self.max_y:
-            self.max_y = y
-        elif y < self.min_y:
-            self.min_y = y
-
-    def _get_bar_object(self, x, y, value, pos):
+    @property
+    def no_of_missing(self):
+        return self._no_of_missing
+
+    @no_of_missing.setter
+    def no_of_missing(self, value):
+        self._no_of_missing = value
+
+    def count_missing(self, mask):
+        self._no_of_missing += int(np.count_nonzero(mask))
+
+    def add_bounds(self, x0, y0, x1, y1):
+        """
+        Extends the plot limits to include the rectangles (x0, y0)-(x1, y1).
+        All arguments can be arrays, limits are updated with a single
+        reduction over them
+        """
+        x = np.concatenate((np.ravel(x0), np.ravel(x1))).astype(float)
+        y = np.concatenate((np.ravel(y0), np.ravel(y1))).astype(float)
+        if x.size == 0:
+            return
+        self.min_x = min(self.min_x, float(x.min()))
+        self.max_x = max(self.max_x, float(x.max()))
+        self.min_y = min(self.min_y, float(y.min()))
+        self.max_y = max(self.max_y, float(y.max()))
+
+    def element_bounds(self, x, y, values) -> tuple:
+        """
+        (x0, y0, x1, y1) arrays of the rectangles occupied by the elements
+        at given locations, same as drawn by 'get' or 'get_collection'
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        width, height = self.sizes(values)
+        if self.cm.plot_type == PLOT_NETWORK:
+            # Locations of the network nodes are their centers
+            x, y = x - width / 2, y - height / 2
+        return x, y, x + width, y + height
+
+    def sizes(self, values) -> tuple:
+        """
+        Widths and heights of the elements with given values, same as used
+        by 'get'
+        """
+        values = np.asarray(values, dtype=float)
+        fixed = np.full(len(values), float(self.width))
+        if self.cm.plot_type in [PLOT_BAR, PLOT_STACKED_BAR,
+                                 PLOT_GROUPED_BAR, PLOT_HIST]:
+            # Missing bars have zero length
+            values = np.where(np.isnan(values), 0, values)
+            if self.am.orientation == "x":
+                return fixed, values
+            return values, fixed
+        return fixed, np.full(len(values), float(self.height))
+
+    def get_collection(self, x, y, values, colors, options=None,
+                       visible=None):
+        """
+        All elements as a single collection. Equivalent to adding each
+        element from 'get' but without creating them one by one. Limits
+        are updated for all elements while only 'visible' ones are drawn
+        """
+        colors = np.asarray(colors, dtype=float).reshape(-1, 4)
+        x, y, x1, y1 = self.element_bounds(x, y, values)
+        self.add_bounds(x, y, x1, y1)
+        width, height = x1 - x, y1 - y
+        if visible is not None:
+            x, y, width, height, colors = [v[visible] for v in
+                                           (x, y, width, height, colors)]
+
+        options = dict(self.options if options is None else options)
+        # Same as the patches, where 'color' overrides other colors
+        for key in ["color", "c", "facecolor", "fc", "edgecolor", "ec"]:
+            options.pop(key, None)
+        fill = options.pop("fill", True)
+        return shape_collection(self.shape, x, y, width, height,
+                                self.rotation,
+                                facecolors=colors if fill else "none",
+                                edgecolors=colors, **options)
+
+    def _get_bar_object(self, x, y, value, pos, missing, color):
         e = Element(self._log)
         e.add_options(**self.options)
 
-        if np.isnan(value):
-            self._no_of_missing += 1
+        if missing:
             value = 0
         else:
-            e.add_options(color=self.cm.color(pos, value))
+            e.add_options(color=self._color(pos, value, color))
         e.shape = self.shape
         if self.am.orientation == "x":
             e.width = self.width
@@ -87,42 +176,52 @@ class ObjectManager:
             e.width = value
             e.height = self.width
 
-        self._check_limits(x, y)
-        self._check_limits(x + e.width, y + e.height)
         return e.get(x, y)
 
-    def _get_network_object(self, x, y, value, pos):
+    def _get_network_object(self, x, y, value, pos, missing, color):
         e = Element(self._log)
         e.add_options(**self.options)
         e.width = self.width
         e.height = self.height
-        e.add_options(color=self.cm.color(pos, value))
-        self._check_limits(x - e.width / 2, y - e.height / 2)
-        self._check_limits(x + e.width / 2, y + e.height / 2)
+        e.add_options(color=self._color(pos, value, color))
         return e.get(x - e.width / 2, y - e.height / 2)
 
-    def _get_colormap_object(self, x, y, value, pos):
+    def _get_colormap_object(self, x, y, value, pos, missing, color):
         e = Element(self._log)
-        if np.isnan(value):
-            self._no_of_missing += 1
+        if missing:
             e.add_options(**self.missing_options)
         else:
             e.add_options(**self.options)
-        e.add_options(color=self.cm.color(pos, value))
+        e.add_options(color=self._color(pos, value, color))
         e.shape = self.shape
         e.width = self.width
         e.height = self.height
-        self._check_limits(x, y)
-        self._check_limits(x + e.width, y + e.height)
         return e.get(x, y)
 
-    def get(self, x, y, value, pos):
-        if self.cm.plot_type in [PLOT_BAR, PLOT_STACKED_BAR, PLOT_GROUPED_BAR]:
-            return self._get_bar_object(x, y, value, pos)
+    def _color(self, pos, value, color):
+        if color is None:
+            return self.cm.color(pos, value)
+        return color
+
+    def get(self, x, y, value, pos, missing=None, color=None):
+        """
+        Limits are not updated for individual elements, use 'add_bounds'
+        with 'element_bounds' of all the elements instead. Missing values
+        are counted separately (see 'count_missing'). If 'missing' is not
+        given, it is decided from the value itself. Color can be given
+        directly when it is already calculated with 'ColorManager.colors'
+        """
+        if missing is None:
+            missing = np.isnan(value)
+        if self.cm.plot_type in [PLOT_BAR, PLOT_STACKED_BAR, PLOT_GROUPED_BAR,
+                                 PLOT_HIST]:
+            return self._get_bar_object(x, y, value, pos, missing, color)
         elif self.cm.plot_type in [PLOT_COLOR_MAP, PLOT_BOOLEAN_PLOT]:
-            return self._get_colormap_object(x, y, value, pos)
+            return self._get_colormap_object(x, y, value, pos, missing,
+                                             color)
         elif self.cm.plot_type in [PLOT_NETWORK]:
-            return self._get_network_object(x, y, value, pos)
+            return self._get_network_object(x, y, value, pos, missing,
+                                            color)
         else:
             self._log.error("ObjectManager for {} is not set".format(
                 self.cm.plot_type))
@@ -13,7 +13,8 @@ import numpy as np
 
 from SecretPlots.constants import *
 from SecretPlots.managers._axis import AxisManager
-from SecretPlots.managers.location._base import LocationManager
+from SecretPlots.managers.location._base import (LocationManager,
+                                                   stack_offsets)
 from SecretPlots.objects import Data
 from SecretPlots.utils import Log
 
@@ -30,38 +31,21 @@ class BarLocations(LocationManager):
 
     def _simple_bars(self, data: Data):
         self._log.info("Calculating positions for simple Bars")
-        points = []
-        for loc in data.positions:
-            points.append((
-                self.major + loc[1] * (self.width + self.major_gap),
-                self.minor
-            ))
-        return points
+        cols = data.positions[:, 1]
+        major = self.major + cols * (self.width + self.major_gap)
+        return np.column_stack((major, np.full(len(major), self.minor)))
 
     def _stacked_bars(self, data: Data):
         self._log.info("Calculating positions for Stacked Bars")
-        points = []
-        stack = None
-        last_col = 0
-        for loc, value in zip(data.positions, data.value):
-            if np.isnan(value):
-                value = 0
-                self._log.warn("NaN value found, ignoring its effect")
-            m1, m2 = loc
-            if stack is None:
-                stack = self.minor
-            if m1 != last_col:
-                stack = self.minor
-                last_col += 1
-
-            points.append((
-                self.major + m1 * (self.width + self.major_gap),
-                stack
-            ))
-            stack += value + self.minor_gap
-        return points
-
-    def get(self, data: Data) -> list:
+        rows = data.positions[:, 0]
+        major = self.major + rows * (self.width + self.major_gap)
+        # Missing values do not take any space in the stack
+        values = np.asarray(data.value, dtype=float)
+        values = np.where(data.mask | np.isnan(values), 0, values)
+        minor = stack_offsets(rows, values + self.minor_gap, self.minor)
+        return np.column_stack((major, minor))
+
+    def get_array(self, data: Data) -> np.ndarray:
         self.validate(data)
 
         if data.type in [Data.SINGLE_VALUED, Data.SIMPLE_CATEGORICAL]:
@@ -93,29 +77,19 @@ class BarGroupLocations(LocationManager):
 
     def _simple_bars(self, data: Data):
         self._log.info("Calculating positions for simple Bars")
-        points = []
-        for loc in data.positions:
-            points.append((
-                self.major + loc[1] * (self.width + self.major_gap),
-                self.minor
-            ))
-        return points
+        cols = data.positions[:, 1]
+        major = self.major + cols * (self.width + self.major_gap)
+        return np.column_stack((major, np.full(len(major), self.minor)))
 
     def _grouped_bars(self, data: Data):
         self._log.info("Calculating positions for Grouped Bars")
-        points = []
-        bars = -1
-        for loc, value in zip(data.positions, data.value):
-            m1, m2 = loc
-            bars += 1
-            points.append((
-                self.major + bars * (self.width + self.major_gap) +
-                m1 * self.group_gap,
-                self.minor
-            ))
-        return points
-
-    def get(self, data: Data) -> list:
+        groups = data.positions[:, 0]
+        bars = np.arange(len(groups))
+        major = (self.major + bars * (self.width + self.major_gap) +
+                 groups * self.group_gap)
+        return np.column_stack((major, np.full(len(major), self.minor)))
+
+    def get_array(self, data: Data) -> np.ndarray:
         self.validate(data)
 
         if data.type in [Data.SINGLE_VALUED, Data.SIMPLE_CATEGORICAL]:
@@ -132,7 +106,54 @@ class BarGroupLocations(LocationManager):
                             "GroupedBarPlot")
 
 
+def iter_chunks(data, chunk_size: int):
+    """
+    Yields flat float chunks of the data. Arrays (including memory-mapped
+    ones) are sliced in chunks of 'chunk_size' values, sequence or iterator
+    of arrays is consumed one item at a time without joining them.
+
+    :param data: Array-like, iterable of array-likes or a generator
+    :param chunk_size: Maximum number of values per chunk for arrays
+    """
+    if hasattr(data, "to_numpy"):
+        data = data.to_numpy()
+    if np.isscalar(data):
+        data = [data]
+    if isinstance(data, (list, tuple)):
+        if all(np.isscalar(x) or x is None for x in data):
+            data = np.asarray(data, dtype=float)
+        else:
+            data = iter(data)
+    if isinstance(data, np.ndarray):
+        data = data.reshape(-1)
+        for i in range(0, len(data), chunk_size):
+            yield np.asarray(data[i:i + chunk_size], dtype=float)
+        return
+    for item in data:
+        if hasattr(item, "to_numpy"):
+            item = item.to_numpy()
+        yield np.asarray(item, dtype=float).reshape(-1)
+
+
+def bin_counts(values: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """
+    Same as np.histogram(values, edges)[0] for fixed edges. Values outside
+    the edges and NaN are ignored.
+    """
+    n = len(edges) - 1
+    index = np.searchsorted(edges, values, side="right") - 1
+    # Last bin includes its right edge
+    index[values == edges[-1]] = n - 1
+    index = index[(index >= 0) & (index < n)]
+    return np.bincount(index, minlength=n)
+
+
 class HistLocations(LocationManager):
+    """
+    Bins the values on the fly. Edges are fixed from the first chunk (or
+    from 'range' / explicit edges) and counts of every later chunk are
+    added to them, so the values themselves are never stored.
+    """
 
     @property
     def plot_type(self):
@@ -141,21 +162,91 @@ class HistLocations(LocationManager):
     def __init__(self, am: AxisManager, om, log: Log, bins=None):
         super().__init__(am, om, log)
         if bins is None:
-            bins = "autp"
+            bins = "auto"
         self.bins = bins
+        self.chunk_size = 2 ** 20
         self._hist_options = {}
+        self._edges = None
+        self._counts = None
+        self.no_of_values = 0
+        self.no_of_outside = 0
+
+    @property
+    def edges(self) -> np.ndarray:
+        return self._edges
+
+    @property
+    def counts(self) -> np.ndarray:
+        return self._counts
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Height of each bin, counts or density (if 'density' option is used)
+        """
+        if self._counts is None:
+            return np.zeros(0)
+        if not self._hist_options.get("density", False):
+            return self._counts
+        total = self._counts.sum()
+        if total == 0:
+            return np.zeros(len(self._counts))
+        return self._counts / total / np.diff(self._edges)
+
+    def _fix_edges(self, chunk: np.ndarray, data_range=None):
+        data_range = self._hist_options.get("range", data_range)
+        if np.ndim(self.bins) == 1:
+            self._edges = np.asarray(self.bins, dtype=float)
+        else:
+            self._edges = np.histogram_bin_edges(chunk, self.bins,
+                                                 range=data_range)
+        self._counts = np.zeros(len(self._edges) - 1, dtype=np.int64)
+        self._log.info("Histogram edges are fixed with {} bins".format(
+            len(self._counts)))
+
+    def add(self, data):
+        """
+        Adds counts of the given values to the bins.
+
+        :param data: Array-like, iterable of array-likes or a generator
+        """
+        data_range = None
+        if (self._edges is None and isinstance(data, np.ndarray) and
+                "range" not in self._hist_options):
+            # Full range is known beforehand for arrays
+            data_range = (np.nanmin(data), np.nanmax(data))
+        outside = 0
+        for chunk in iter_chunks(data, self.chunk_size):
+            chunk = chunk[~np.isnan(chunk)]
+            if self._edges is None:
+                if len(chunk) == 0:
+                    continue
+                self._fix_edges(chunk, data_range)
+            counts = bin_counts(chunk, self._edges)
+            self._counts += counts
+            self.no_of_values += len(chunk)
+            outside += len(chunk) - counts.sum()
+        if outside > 0:
+            self._log.warn("{} values are outside of histogram edges ({}, "
+                           "{}) and are ignored".format(outside,
+                                                        self._edges[0],
+                                                        self._edges[-1]))
+        self.no_of_outside += outside
 
     def validate(self, data: Data):
-        if data.type != Data.SIMPLE_CATEGORICAL:
-            self._log.warn("Data will be flatten for histogram")
+        if self._counts is None:
+            self._log.error("No values are binned for the histogram")
         self._log.info("Valid data is provided for Histogram")
 
-    def get(self, data: Data):
+    def get_array(self, data: Data) -> np.ndarray:
         self.validate(data)
-
-        bins, _ = np.histogram(data.value, self.bins, **self._hist_options)
-        return [(self.major + x * (self.width + self.major_gap), self.minor)
-                for x in range(len(bins))]
+        cols = data.positions[:, 1]
+        major = self.major + cols * (self.width + self.major_gap)
+        return np.column_stack((major, np.full(len(major), self.minor)))
 
     def hist_options(self, **kwargs):
+        for key in kwargs:
+            if key not in ["range", "density"]:
+                self._log.error("Histogram option '{}' is not "
+                                "supported".format(key))
         self._hist_options = {**self._hist_options, **kwargs}
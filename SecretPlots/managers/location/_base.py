@@ -9,12 +9,43 @@
 #
 # All Location Managers will go here
 
+import numpy as np
+
 from SecretPlots.managers._axis import AxisManager
 from SecretPlots.managers._object import ObjectManager
 from SecretPlots.objects import Data
 from SecretPlots.utils import Log
 
 
+def stack_offsets(groups, increments, start=0):
+    """
+    Running offsets of the elements stacked within each group.
+
+    :param groups: Group of each element, elements of a group are contiguous
+    :param increments: Space taken by each element (scalar or array)
+    :param start: Offset of the first element of each group
+    :return: Array with offset of each element
+    """
+    groups = np.asarray(groups)
+    n = len(groups)
+    if n == 0:
+        return np.zeros(0)
+    increments = np.broadcast_to(np.asarray(increments, dtype=float), (n,))
+    first = np.flatnonzero(np.concatenate(([True], groups[1:] != groups[:-1])))
+    sizes = np.diff(np.append(first, n))
+    offsets = np.empty(n)
+    # Groups of the same size are summed together in a table without any
+    # padding. Summing along its rows keeps the order same as adding the
+    # elements one after another
+    for size in np.unique(sizes):
+        index = first[sizes == size][:, None] + np.arange(size)
+        table = np.empty(index.shape)
+        table[:, 0] = start
+        table[:, 1:] = increments[index[:, :-1]]
+        offsets[index] = np.cumsum(table, axis=1)
+    return offsets
+
+
 class LocationManager:
     def __init__(self, am: AxisManager, om: ObjectManager, log: Log):
         self._log = log
@@ -59,5 +90,12 @@ class LocationManager:
     def validate(self, data: Data):
         raise NotImplementedError
 
-    def get(self, data: Data):
+    def get_array(self, data: Data) -> np.ndarray:
+        """
+        :param data: Data
+        :return: (N, 2) array with (major, minor) location of each element
+        """
         raise NotImplementedError
+
+    def get(self, data: Data) -> list:
+        return [tuple(x) for x in self.get_array(data)]
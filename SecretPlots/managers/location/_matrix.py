@@ -10,8 +10,11 @@
 #
 # Matrix Locators
 
+import numpy as np
+
 from SecretPlots.constants.graph import *
-from SecretPlots.managers.location._base import LocationManager
+from SecretPlots.managers.location._base import (LocationManager,
+                                                   stack_offsets)
 from SecretPlots.objects import Data
 
 
@@ -28,51 +31,43 @@ class ColorMapLocations(LocationManager):
     def _single_column(self, data: Data):
 
         self._log.info("Calculating positions for simple Bars")
-        points = []
-        for loc in data.positions:
-            points.append((
-                self.major,
-                self.minor + loc[1] * (self.height + self.minor_gap)
-            ))
-        return points
+        cols = data.positions[:, 1]
+        minor = self.minor + cols * (self.height + self.minor_gap)
+        return np.column_stack((np.full(len(minor), self.major), minor))
 
-    def _matrix_columns(self, data: Data):
-        points = []
-        for loc in data.positions:
-            row, col = loc
-            points.append((
-                self.major + row * (self.width + self.major_gap),
-                self.minor + col * (self.height + self.minor_gap)
-            ))
-        return points
+    def _matrix_columns(self, positions):
+        rows, cols = np.asarray(positions).reshape(-1, 2).T
+        major = self.major + rows * (self.width + self.major_gap)
+        minor = self.minor + cols * (self.height + self.minor_gap)
+        return np.column_stack((major, minor)).astype(float)
 
     def _complex_columns(self, data: Data):
-        points = []
-        stack = None
-        col_no = 0
-        for loc in data.positions:
-            row, col = loc
-            if stack is None:
-                stack = self.minor
-            if col_no != row:
-                stack = self.minor
-                col_no = row
-            points.append((
-                self.major + row * (self.width + self.major_gap),
-                stack
-            ))
-            stack += self.height + self.minor_gap
-
-        return points
+        rows = data.positions[:, 0]
+        major = self.major + rows * (self.width + self.major_gap)
+        minor = stack_offsets(rows, self.height + self.minor_gap, self.minor)
+        return np.column_stack((major, minor))
 
-    def get(self, data: Data):
+    def get_array(self, data: Data) -> np.ndarray:
         self.validate(data)
         if data.type in [Data.SINGLE_VALUED, Data.SIMPLE_CATEGORICAL]:
             return self._single_column(data)
         elif data.type in [Data.POINTS, Data.MATRIX]:
-            return self._matrix_columns(data)
+            return self._matrix_columns(data.positions)
         elif data.type == Data.COMPLEX_CATEGORICAL:
             return self._complex_columns(data)
         else:
             self._log.error("Data type {} does not support ColorMap".format(
                 data.type_name))
+
+    def blocks(self, data: Data):
+        """
+        Yields (locations, values, positions, mask) for each block of the
+        data (see Data.blocks) so that large matrices are located block by
+        block
+        """
+        if data.type != Data.MATRIX:
+            yield self.get_array(data), data.value, data.positions, data.mask
+            return
+        self.validate(data)
+        for positions, values, mask in data.blocks():
+            yield self._matrix_columns(positions), values, positions, mask
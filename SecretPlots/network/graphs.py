@@ -12,29 +12,31 @@
 
 from collections import defaultdict
 
-import matplotlib.pyplot as plt
-from SecretColors import Palette
 from SecretColors.utils import text_color
+from matplotlib.axes import Axes
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
 from matplotlib.lines import Line2D
 
 from SecretPlots.constants.network import *
 from SecretPlots.network.pathfinder import *
-from SecretPlots.objects.shapes import Rectangle
-from SecretPlots.utils import Log
+from SecretPlots.objects.shapes import rectangle_vertices
+from SecretPlots.utils import (Log, ClosablePlot, get_palette, new_figure,
+                               show_figure, close_figure)
 
 
-class NetworkPlot:
-    def __init__(self, data, fig: plt.Figure = None, log: Log = None):
+class NetworkPlot(ClosablePlot):
+    def __init__(self, data, fig: Figure = None, log: Log = None):
         if log is None:
             log = Log()
         if fig is None:
-            fig = plt.figure()
+            fig = new_figure()
 
         self._log = log
         self.data = data
-        self.palette = Palette()
+        self.palette = get_palette(show_warning=True)
         self._space = None
-        self.fig = fig  # type: plt.Figure
+        self.fig = fig  # type: Figure
 
         # Options
         self.use_dijkstra = True
@@ -54,11 +56,14 @@ class NetworkPlot:
         self._line_options = None
         self._fig_drawn = False
         self._all_nodes = None
+        self._closed = False
+        # Release the figure after it is saved
+        self.auto_close = False
 
         self._log.info("Network Plot is initialized")
 
     @property
-    def ax(self) -> plt.Axes:
+    def ax(self) -> Axes:
         if self._ax is None:
             self._ax = self.fig.subplots()
         return self._ax
@@ -80,7 +85,8 @@ class NetworkPlot:
     def _color_cycle(self):
         while True:
             if self.colors is None:
-                for p in self.palette:
+                # Palette is shared, hence its own iterator is not used
+                for p in self.palette.get_color_list:
                     yield p
             else:
                 if type(self.colors) == str:
@@ -110,7 +116,7 @@ class NetworkPlot:
             self._draw_elements()
         return self._all_nodes
 
-    def _add_text(self, r: Rectangle, text: str):
+    def _add_text(self, r: Node, text: str):
         self.ax.text(
             r.x + r.width / 2,
             r.y + r.height / 2,
@@ -316,24 +322,36 @@ class NetworkPlot:
 
         all_x = []
         all_y = []
-        # Draw nodes
         for m in s:
             all_x.extend([m.x, m.x + m.width])
             all_y.extend([m.y, m.y + m.height])
             if not m.is_gap:
-                r = Rectangle(m.x, m.y, height=m.height, width=m.width,
-                              color=self._get_color(m.name, palette))
-                m.color = r.color
-                self.ax.add_patch(r.get())
-                self._add_text(r, m.name)
+                m.color = self._get_color(m.name, palette)
+                self._add_text(m, m.name)
                 all_nodes[m.name] = m
 
+        # Draw all nodes at once
+        nodes = list(all_nodes.values())
+        colors = [m.color for m in nodes]
+        self.ax.add_collection(PolyCollection(
+            rectangle_vertices([m.x for m in nodes], [m.y for m in nodes],
+                               [m.width for m in nodes],
+                               [m.height for m in nodes]).reshape(-1, 5, 2),
+            closed=False, facecolors=colors, edgecolors=colors))
+
         self._all_nodes = all_nodes
         self.ax.set_xlim(min(all_x), max(all_x))
         self.ax.set_ylim(min(all_y), max(all_y))
         self._log.info("All nodes arranged in the space")
 
-    def draw(self, ax: plt.Axes = None):
+    def _release(self):
+        close_figure(self.fig)
+        self._ax = None
+        self._space = None
+        self._all_nodes = None
+
+    def draw(self, ax: Axes = None):
+        self._check_open()
         # Sanity check to avoid redrawing
         if ax is not None:
             self._ax = ax
@@ -352,14 +370,20 @@ class NetworkPlot:
     def show(self, tight=False):
         self.draw()
         if tight:
-            plt.tight_layout()
-        plt.show()
-
-    def save(self, filename, tight=False, **kwargs):
+            self.fig.tight_layout()
+        show_figure(self.fig, self._log)
+
+    def save(self, filename, tight=False, close: bool = None, **kwargs):
+        """
+        :param close: Close the plot after saving, 'auto_close' is used if
+            not given
+        """
         self.draw()
         if tight:
-            plt.tight_layout()
-        plt.savefig(filename, **kwargs)
+            self.fig.tight_layout()
+        self.fig.savefig(filename, **kwargs)
+        if close or (close is None and self.auto_close):
+            self.close()
 
 
 def run():
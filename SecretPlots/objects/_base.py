@@ -10,10 +10,86 @@
 #
 # Basic Objects
 
-from SecretPlots.objects.shapes import *
+import os
+from collections.abc import Iterator
+
+import numpy as np
+
 from SecretPlots.utils import Log
 
 
+class Summary:
+    """
+    Summary statistics of the dataset. Missing (NaN) values are ignored in
+    all the statistics. Values are added block by block with 'update' so
+    that everything is calculated in a single pass over the data.
+    """
+
+    def __init__(self, rows: int, columns: int):
+        self.min = np.nan
+        self.max = np.nan
+        self.sum = 0.0
+        self.count = 0
+        self.missing = 0
+        self.row_min = np.full(rows, np.nan)
+        self.row_max = np.full(rows, np.nan)
+        self.column_min = np.full(columns, np.nan)
+        self.column_max = np.full(columns, np.nan)
+
+    @staticmethod
+    def _pad(values: np.ndarray, size: int) -> np.ndarray:
+        extra = max(0, size - len(values))
+        return np.concatenate((values, np.full(extra, np.nan)))
+
+    def expand(self, rows: int, columns: int):
+        """
+        Makes space for the new rows and columns (e.g. after appending data)
+        """
+        self.row_min = self._pad(self.row_min, rows)
+        self.row_max = self._pad(self.row_max, rows)
+        self.column_min = self._pad(self.column_min, columns)
+        self.column_max = self._pad(self.column_max, columns)
+
+    def update(self, positions: np.ndarray, values: np.ndarray,
+               mask: np.ndarray, columns: int = None):
+        """
+        :param positions: (N, 2) positions of the values
+        :param values: Flat values
+        :param mask: Boolean array, True where the value is missing
+        :param columns: If values are complete rows of a matrix with given
+        number of columns, extrema are calculated by reshaping instead of
+        scattering on positions
+        """
+        missing = np.count_nonzero(mask)
+        if missing > 0:
+            self.missing += missing
+            positions = positions[~mask]
+            values = values[~mask]
+            columns = None
+        if values.size == 0:
+            return
+        self.min = np.fmin(self.min, np.fmin.reduce(values))
+        self.max = np.fmax(self.max, np.fmax.reduce(values))
+        self.sum += np.nansum(values)
+        self.count += values.size
+
+        if columns is not None:
+            block = values.reshape(-1, columns)
+            rows = slice(positions[0, 0], positions[0, 0] + len(block))
+            self.row_min[rows] = np.fmin.reduce(block, axis=1)
+            self.row_max[rows] = np.fmax.reduce(block, axis=1)
+            self.column_min = np.fmin(self.column_min,
+                                      np.fmin.reduce(block, axis=0))
+            self.column_max = np.fmax(self.column_max,
+                                      np.fmax.reduce(block, axis=0))
+        else:
+            rows, cols = positions[:, 0], positions[:, 1]
+            np.fmin.at(self.row_min, rows, values)
+            np.fmax.at(self.row_max, rows, values)
+            np.fmin.at(self.column_min, cols, values)
+            np.fmax.at(self.column_max, cols, values)
+
+
 class Data:
     """
     Class to hold and transform data
@@ -51,62 +127,427 @@ class Data:
     MATRIX = 3
     COMPLEX_CATEGORICAL = 4
 
-    def __init__(self, data, log: Log):
-        self._raw_data = data
+    def __init__(self, data, log: Log, dtype=None):
         self._log = log
+        self._dtype = dtype
+        self.row_labels = None
+        self.column_labels = None
+        self._input_mask = None
         self._type = None
         self._value = None
+        self._offsets = None
+        self._mask = None
         self._positions = None
+        self._summary = None
+        # Growing buffers of value, mask and positions (see 'append')
+        self._store = None
         self.threshold = None
+        # Number of values read at a time from memory-mapped data
+        self.block_size = 2 ** 20
+        self._raw_data = self._ingest(data)
+
+    def _ingest(self, data):
+        """
+        Converts labelled tabular data (pandas DataFrame, Series and pyarrow
+        Table) into numpy array and keeps its row and column labels.
+        Numeric blocks are used without copying wherever possible. Iterators
+        (e.g. generators) are consumed only once. Any other data is
+        returned as it is
+        """
+        if isinstance(data, Iterator):
+            return self._consume(data)
+        if isinstance(data, (str, os.PathLike)):
+            # Data saved with np.save, mapped instead of loading in memory
+            data = np.load(data, mmap_mode="r")
+            if not isinstance(data, np.ndarray):
+                self._log.error("Only '.npy' files are supported as an "
+                                "input path")
+            self._log.info("Data is memory-mapped from the file")
+            return data
+        if isinstance(data, np.ma.MaskedArray):
+            # Underlying data is used as it is, mask is kept separately
+            if data.mask is not np.ma.nomask:
+                self._input_mask = np.ma.getmaskarray(data)
+            return data.data
+        library = type(data).__module__.split(".")[0]
+        if library == "pandas" and hasattr(data, "to_numpy"):
+            if data.ndim == 1:
+                # Series becomes Simple Categorical, hence index belongs to
+                # the columns
+                self.column_labels = list(data.index)
+                return self._pandas_values([data.array])
+            numeric = data.select_dtypes(include=["number", "bool"])
+            if numeric.shape[1] != data.shape[1]:
+                self._log.warn("Non-numeric columns are ignored : {}".format(
+                    [x for x in data.columns if x not in numeric.columns]))
+                data = numeric
+            if data.shape[1] == 1:
+                self.column_labels = list(data.index)
+            else:
+                self.row_labels = list(data.index)
+                self.column_labels = list(data.columns)
+            if any(self._is_masked_array(data[x].array)
+                   for x in data.columns):
+                return self._pandas_values([data[x].array
+                                            for x in data.columns])
+            return data.to_numpy()
+        elif library == "pyarrow" and hasattr(data, "column_names"):
+            columns = [c.to_numpy() for c in data.columns]
+            if len(columns) == 1:
+                return columns[0]
+            self.column_labels = list(data.column_names)
+            return np.column_stack(columns)
+        return data
+
+    @property
+    def summary(self) -> Summary:
+        """
+        Cached summary statistics of the data. It is calculated only once
+        and then updated only with the newly appended values
+        """
+        if self._summary is None:
+            rows, cols = self.grid_shape
+            summary = Summary(rows, cols)
+            full_rows = cols if self.type == Data.MATRIX else None
+            for positions, values, mask in self.blocks():
+                summary.update(positions, values, mask, full_rows)
+            self._summary = summary
+            self._log.info("Summary statistics calculated")
+        return self._summary
+
+    def _consume(self, rows: Iterator) -> np.ndarray:
+        """
+        Reads iterator in a single pass. Values are collected in a single
+        buffer which grows geometrically while row sizes are used for data
+        type classification (same rules as '_check_multi_dimension').
+        Regular data is returned as an array with equivalent shape while
+        uneven data is directly stored in the ragged (CSR like) form
+        """
+        buffer = np.empty(1024, dtype=np.float64)
+        sizes = np.empty(1024, dtype=int)
+        scalar_rows = True
+        n_values = 0
+        n_rows = 0
+        for row in rows:
+            row = self._cast(row)
+            scalar_rows = scalar_rows and row.ndim == 0
+            row = row.ravel()
+            if n_values + row.size > len(buffer):
+                buffer.resize(max(2 * len(buffer), n_values + row.size),
+                              refcheck=False)
+            if n_rows == len(sizes):
+                sizes.resize(2 * len(sizes), refcheck=False)
+            buffer[n_values:n_values + row.size] = row
+            sizes[n_rows] = row.size
+            n_values += row.size
+            n_rows += 1
+
+        if n_rows == 0:
+            self._log.error("No data found in the given iterator")
+
+        values = buffer[:n_values]
+        sizes = sizes[:n_rows]
+        self._type = self._type_from_sizes(sizes)
+        if self._type == Data.COMPLEX_CATEGORICAL:
+            self._offsets = np.concatenate(([0], np.cumsum(sizes)))
+            self._value, self._mask = self._apply_dtype(values)
+        self._log.info("{} rows consumed from the iterator and data type "
+                       "assigned as {} ({})".format(n_rows, self.type,
+                                                    self.type_name))
+        if scalar_rows or self._type == Data.COMPLEX_CATEGORICAL:
+            return values
+        return values.reshape(n_rows, -1)
+
+    @staticmethod
+    def _extend(store, used: int, new: np.ndarray) -> tuple:
+        """
+        Writes 'new' after the first 'used' items of the 'store' and returns
+        (store, view of the filled part). Store grows geometrically so that
+        repeated appends are amortised. Arrays which are already handed
+        out are never modified.
+        """
+        needed = used + len(new)
+        if len(store) < needed or store.dtype != np.result_type(store, new):
+            grown = np.empty((max(needed, 2 * used),) + new.shape[1:],
+                             dtype=np.result_type(store, new))
+            grown[:used] = store[:used]
+            store = grown
+        store[used:needed] = new
+        return store, store[:needed]
+
+    def append(self, data, labels: list = None) -> int:
+        """
+        Adds new values to the dataset and updates all cached arrays (value,
+        mask, positions, offsets and summary) incrementally.
+
+        For one dimensional data (Single Valued, Simple Categorical or a
+        single point), 'data' is one or more values which are added as new
+        columns. For everything else, 'data' is an iterable of new rows.
+        Labels of these new columns (or rows) can be given with 'labels',
+        earlier ones without labels are then labelled by their index.
+
+        Returns index of the first new value in the 'value'
+        """
+        start = len(self.value)
+        one_dimensional = (self.type in [Data.SINGLE_VALUED,
+                                         Data.SIMPLE_CATEGORICAL] or
+                           self.is_single_point)
+        previous = start if one_dimensional else len(self.offsets) - 1
+        if one_dimensional:
+            values = self._cast(data).ravel()
+            total = start + len(values)
+            positions = np.column_stack((
+                np.zeros(len(values), dtype=int),
+                np.arange(start, total)))
+            offsets = np.asarray([0, total])
+            # All values are single sized rows
+            data_type = self._type_from_sizes(np.ones(min(total, 3)))
+            grid = (1, total)
+        else:
+            rows = [self._cast(x).ravel() for x in data]
+            new_sizes = [x.size for x in rows]
+            values = np.concatenate(rows)
+            positions = self._ragged_positions(new_sizes)
+            positions[:, 0] += len(self.offsets) - 1
+            offsets = np.concatenate((self.offsets, self.offsets[-1] +
+                                      np.cumsum(new_sizes)))
+            sizes = np.diff(offsets)
+            data_type = self._type_from_sizes(sizes)
+            grid = (len(sizes), int(sizes.max()))
+
+        values, mask = self._apply_dtype(values)
+        current = self.value.dtype
+        if values.dtype != current and current.kind in "biu":
+            # Keep integer storage as long as new values are integers
+            filled = np.where(mask, 0, values)
+            if np.all(filled == filled.astype(current)):
+                values = filled.astype(current)
+
+        store = self._store
+        if store is None:
+            store = (self.value, self.mask, self.positions)
+        value_store, self._value = self._extend(store[0], start, values)
+        mask_store, self._mask = self._extend(store[1], start, mask)
+        pos_store, self._positions = self._extend(store[2], start, positions)
+        self._store = (value_store, mask_store, pos_store)
+        self._offsets = offsets
+        self._input_mask = self._mask
+
+        self._type = data_type
+        if one_dimensional or self._type == Data.COMPLEX_CATEGORICAL:
+            self._raw_data = self._value
+        else:
+            self._raw_data = self._value.reshape(grid[0], -1)
+
+        if labels is not None:
+            # Earlier columns (or rows) without labels are labelled by their
+            # index
+            if one_dimensional:
+                existing = self.column_labels
+            else:
+                existing = self.row_labels
+            if existing is None:
+                existing = range(previous)
+            if one_dimensional:
+                self.column_labels = list(existing) + list(labels)
+            else:
+                self.row_labels = list(existing) + list(labels)
+
+        if self._summary is not None:
+            self._summary.expand(*grid)
+            self._summary.update(positions, values, mask)
+
+        self._log.info("{} values appended to the data".format(len(values)))
+        return start
+
+    @staticmethod
+    def _is_masked_array(array) -> bool:
+        # pandas nullable arrays (Int64, Float64, boolean) keep missing
+        # values in a mask instead of NaN
+        import pandas as pd
+        return isinstance(array, (pd.arrays.IntegerArray,
+                                  pd.arrays.FloatingArray,
+                                  pd.arrays.BooleanArray))
+
+    @staticmethod
+    def _nullable_values(array) -> np.ndarray:
+        """
+        Values of a pandas nullable array in its numpy dtype, missing values
+        are filled (NaN for floats) as they are tracked in the mask
+        """
+        dtype = array.dtype.numpy_dtype
+        fill = np.nan if dtype.kind == "f" else 0
+        return array.to_numpy(dtype=dtype, na_value=fill)
+
+    def _pandas_values(self, columns: list) -> np.ndarray:
+        """
+        Values of the pandas columns (extension arrays). Nullable arrays are
+        split into their values and mask instead of converting them to
+        object arrays. Single column without missing values is used without
+        copying
+        """
+        if len(columns) == 1:
+            if self._is_masked_array(columns[0]):
+                self._input_mask = np.asarray(columns[0].isna())
+                return self._nullable_values(columns[0])
+            return np.asarray(columns[0])
+        values = [self._nullable_values(c) if self._is_masked_array(c)
+                  else np.asarray(c) for c in columns]
+        masks = [np.asarray(c.isna()) if self._is_masked_array(c)
+                 else np.zeros(len(c), dtype=bool) for c in columns]
+        self._input_mask = np.column_stack(masks)
+        return np.column_stack(values)
 
     @property
     def max(self):
-        return np.nanmax(self.value)
+        return self.summary.max
 
     @property
     def min(self):
-        return np.nanmin(self.value)
+        return self.summary.min
 
     @property
-    def value(self):
+    def grid_shape(self) -> tuple:
+        """
+        Number of rows and columns spanned by the positions
         """
-        Flatten values of the entire dataset
+        if self.type == Data.MATRIX:
+            shape = self._raw_shape() or np.shape(self._raw_data)
+            return shape[0], int(np.prod(shape[1:]))
+        if len(self.positions) == 0:
+            return 0, 0
+        rows, cols = self.positions.max(axis=0) + 1
+        return int(rows), int(cols)
 
-        Argument 'dtype=np.float' is required for replacement of None
+    @property
+    def is_memmap(self) -> bool:
+        return isinstance(self._raw_data, np.memmap)
+
+    def blocks(self):
+        """
+        Yields (positions, values, mask) of the dataset in blocks of rows.
+        Only memory-mapped Matrix is split into blocks of approximately
+        'block_size' values, which are read from the file one by one so that
+        the entire matrix is never loaded in memory. All other data is
+        returned as a single block.
+        """
+        if not self.is_memmap or self.type != Data.MATRIX:
+            yield self.positions, self.value, self.mask
+            return
+        rows = self._raw_data.shape[0]
+        cols = int(np.prod(self._raw_data.shape[1:]))
+        step = max(1, self.block_size // max(cols, 1))
+        for start in range(0, rows, step):
+            stop = min(start + step, rows)
+            values = self._cast(self._raw_data[start:stop]).reshape(-1)
+            values, mask = self._apply_dtype(values)
+            positions = np.indices((stop - start, cols)).reshape(2, -1).T
+            positions[:, 0] += start
+            yield positions, values, mask
+
+    @property
+    def dtype(self):
+        """
+        User defined dtype of the values. If None, numeric arrays keep
+        their own dtype and everything else is converted to float64
+        """
+        return self._dtype
+
+    @staticmethod
+    def _cast(data) -> np.ndarray:
+        """
+        Numeric arrays are used as they are (without copy). Everything else
+        is converted to float so that None becomes NaN
+        """
+        if isinstance(data, np.ndarray) and data.dtype.kind in "biuf":
+            return data
+        return np.asarray(data, dtype=np.float64)
+
+    def _apply_dtype(self, values: np.ndarray) -> tuple:
+        """
+        Casts values to the user defined dtype and returns them with the
+        mask of missing values. Missing values are filled with 0 when new
+        dtype can not hold NaN (e.g. integers)
+        """
+        if values.dtype.kind == "f":
+            mask = np.isnan(values)
+        else:
+            mask = np.zeros(values.shape, dtype=bool)
+        if self.dtype is not None and values.dtype != self.dtype:
+            if np.dtype(self.dtype).kind != "f" and mask.any():
+                values = np.where(mask, 0, values)
+            values = values.astype(self.dtype, copy=False)
+        return values, mask
+
+    @property
+    def value(self):
+        """
+        Flatten values of the entire dataset. Its dtype depends on the
+        'dtype' (see Data.dtype) and missing values are tracked in 'mask'
         """
         if self._value is None:
             if self.type != Data.COMPLEX_CATEGORICAL:
-                self._value = np.asarray(self._raw_data,
-                                         dtype=np.float).flatten()
+                values = self._cast(self._raw_data).ravel()
+                self._value, self._mask = self._apply_dtype(values)
+                self._merge_input_mask()
             else:
-                self._value = []
-                for k in self._raw_data:
-                    try:
-                        self._value.extend(np.asarray(k))
-                    except TypeError:
-                        self._value.append(k)
-                self._value = np.asarray(self._value, dtype=np.float)
+                self._assign_ragged()
         return self._value
 
     @property
-    def positions(self):
+    def mask(self) -> np.ndarray:
+        """
+        Boolean array, True where the value is missing
+        """
+        if self._mask is None:
+            _ = self.value
+        return self._mask
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """
+        Group (row) boundaries in the flatten 'value'. Values of i-th group
+        are value[offsets[i]:offsets[i + 1]]
+        """
+        if self._offsets is None:
+            if self.type == Data.COMPLEX_CATEGORICAL:
+                self._assign_ragged()
+            else:
+                counts = np.bincount(self.positions[:, 0])
+                self._offsets = np.concatenate(([0], np.cumsum(counts)))
+        return self._offsets
+
+    @property
+    def group_sizes(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    @property
+    def group_sums(self) -> np.ndarray:
+        """
+        Sum of each group (row) ignoring missing values
+        """
+        return np.bincount(self.positions[:, 0],
+                           weights=np.where(self.mask, 0, self.value),
+                           minlength=len(self.offsets) - 1)
+
+    @property
+    def positions(self) -> np.ndarray:
         """
-        Returns flatten array of positions of the (row, column) in given
-        dataset
+        Returns (N, 2) integer array of positions of the (row, column) in
+        given dataset. Rows are in the same order as that of 'value'
         """
         if self._positions is None:
             if self.type == Data.SINGLE_VALUED:
-                self._positions = [(0, 0)]
+                self._positions = np.zeros((1, 2), dtype=int)
             elif self.type == Data.POINTS:
                 self._assign_point_locations()
             elif self.type == Data.SIMPLE_CATEGORICAL:
-                self._positions = [(0, x) for x in range(len(self._raw_data))]
+                self._positions = np.column_stack((
+                    np.zeros(len(self._raw_data), dtype=int),
+                    np.arange(len(self._raw_data))))
             elif self.type == Data.MATRIX:
-                self._positions = []
-                row, cols = np.asarray(self._raw_data).shape
-                for r in range(row):
-                    for c in range(cols):
-                        self._positions.append((r, c))
+                rows, cols = self.grid_shape
+                self._positions = np.indices((rows, cols)).reshape(2, -1).T
             elif self.type == Data.COMPLEX_CATEGORICAL:
                 self._assign_complex_locations()
 
@@ -150,28 +591,119 @@ class Data:
             except TypeError:
                 return True
 
+    @staticmethod
+    def _ragged_positions(sizes) -> np.ndarray:
+        """
+        (row, column) positions of ragged rows with given sizes
+        """
+        sizes = np.asarray(sizes, dtype=int)
+        rows = np.repeat(np.arange(len(sizes)), sizes)
+        starts = np.repeat(np.cumsum(sizes) - sizes, sizes)
+        return np.column_stack((rows, np.arange(len(rows)) - starts))
+
     def _assign_point_locations(self):
-        self._positions = []
-        for i, x in enumerate(self._raw_data):
-            try:
-                iter(x)
-                for k in range(len(x)):
-                    self.positions.append((i, k))
-            except TypeError:
-                self.positions.append((0, i))
+        if self.is_single_point:
+            self._positions = np.column_stack((np.zeros(2, dtype=int),
+                                               np.arange(2)))
+        else:
+            self._positions = self._ragged_positions(
+                [len(x) for x in self._raw_data])
 
     def _assign_complex_locations(self):
-        self._positions = []
-        for i, x in enumerate(self._raw_data):
-            try:
-                for j, k in enumerate(x):
-                    self._positions.append((i, j))
-            except TypeError:
+        self._positions = self._ragged_positions(self.group_sizes)
+
+    def _assign_ragged(self):
+        """
+        Compact (CSR like) storage of uneven data in a single pass. All
+        values are stored in one flat array and group boundaries in the
+        'offsets' array
+        """
+        rows = []
+        for k in self._raw_data:
+            row = self._cast(k)
+            if row.ndim == 0:
                 self._log.warn("Non-iterable element ({}) found in the "
-                               "Complex Categorical dataset".format(x))
-                self._positions.append((i, 0))
+                               "Complex Categorical dataset".format(k))
+            rows.append(row.ravel())
+        sizes = [x.size for x in rows]
+        self._offsets = np.concatenate(([0], np.cumsum(sizes))).astype(int)
+        if len(rows) > 0:
+            values = np.concatenate(rows)
+        else:
+            values = np.asarray([], dtype=np.float64)
+        self._value, self._mask = self._apply_dtype(values)
+        self._merge_input_mask()
+
+    def _merge_input_mask(self):
+        """
+        Adds mask given with the input (masked or nullable arrays)
+        """
+        if self._input_mask is not None:
+            self._mask = self._mask | self._input_mask.ravel()
+
+    def _raw_shape(self):
+        """
+        Shape of the raw data when it can be read without iterating over
+        the rows i.e. numpy arrays and objects following array or buffer
+        protocol. Returns None for generic Python iterables and object
+        arrays (which might be ragged)
+        """
+        data = self._raw_data
+        if not isinstance(data, np.ndarray):
+            if hasattr(data, "__array_interface__") or hasattr(
+                    data, "__array_struct__"):
+                data = np.asarray(data)
+            else:
+                try:
+                    return memoryview(data).shape
+                except TypeError:
+                    return None
+        if data.dtype == object:
+            return None
+        return data.shape
+
+    @staticmethod
+    def _type_from_shape(shape) -> int:
+        """
+        O(1) classification of data with known shape. Rules are same as
+        that of '_check_multi_dimension' where each row has size equal to
+        the product of remaining dimensions
+        """
+        if len(shape) == 0:
+            return Data.SINGLE_VALUED
+        rows = shape[0]
+        row_size = int(np.prod(shape[1:]))
+        if rows == 2:
+            return Data.POINTS
+        elif rows == 1:
+            return Data.COMPLEX_CATEGORICAL
+        elif row_size == 1:
+            return Data.SIMPLE_CATEGORICAL
+        else:
+            return Data.MATRIX
+
+    @staticmethod
+    def _type_from_sizes(sizes: np.ndarray) -> int:
+        """
+        Classification from the sizes of each row with the same rules as
+        that of '_check_multi_dimension'
+        """
+        regular = np.all(sizes == sizes[0])
+        if len(sizes) == 2 and regular:
+            return Data.POINTS
+        elif regular and len(sizes) != 1:
+            if sizes[0] == 1:
+                return Data.SIMPLE_CATEGORICAL
+            return Data.MATRIX
+        return Data.COMPLEX_CATEGORICAL
 
     def _assign_type(self):
+        shape = self._raw_shape()
+        if shape is not None and (len(shape) == 0 or shape[0] > 0):
+            self._type = self._type_from_shape(shape)
+            self._log.info("Data type assigned as {} ({}) from shape "
+                           "{}".format(self.type, self.type_name, shape))
+            return
         try:
             iter(self._raw_data)
             try:
@@ -219,12 +751,15 @@ class Element:
 
     @property
     def shape(self):
-        if self._shape in ["r", "rectangle", "rect"]:
-            return Rectangle
-        elif self._shape in ["t", "triangle", "tri"]:
-            return Triangle
-        elif self._shape in ["c", "circle", "cir"]:
-            return Circle
+        # Shapes need matplotlib, which is not needed for the Data
+        from SecretPlots.objects import shapes
+        name = shapes.shape_name(self._shape)
+        if name == "rectangle":
+            return shapes.Rectangle
+        elif name == "triangle":
+            return shapes.Triangle
+        elif name == "circle":
+            return shapes.Circle
         else:
             self._log.error("Shape {} not found".format(self._shape))
 
@@ -268,6 +803,12 @@ class Axis:
         self._edgelines = None
         self._label = None
         self._label_options = None
+        # Automatically generated values are regenerated on every draw
+        self._auto_ticks = False
+        self._auto_labels = False
+        self._auto_midlines = False
+        # Ticks which can not fit in the axis are skipped while drawing
+        self.thin_ticks = True
 
         self.scale = None
         self.limit = (0, 1)
@@ -286,8 +827,13 @@ class Axis:
 
     @ticks.setter
     def ticks(self, values):
+        self._auto_ticks = False
         self._ticks = values
 
+    @property
+    def is_auto_ticks(self):
+        return self._auto_ticks
+
     @property
     def label(self):
         return self._label
@@ -312,6 +858,7 @@ class Axis:
 
     @midlines.setter
     def midlines(self, values):
+        self._auto_midlines = False
         self._midlines = values
 
     @edgelines.setter
@@ -356,6 +903,7 @@ class Axis:
 
     @tick_labels.setter
     def tick_labels(self, values):
+        self._auto_labels = False
         self._tick_labels = values
 
     @property
@@ -399,37 +947,66 @@ class Axis:
     def add_missing_region(self, p1, length):
         self._missing_region.append((p1, p1 + length))
 
+    def add_missing_regions(self, starts, length):
+        starts = np.asarray(starts)
+        self._missing_region.extend(zip(starts, starts + length))
+
+    def merged_missing_regions(self) -> np.ndarray:
+        """
+        Missing regions as (N, 2) array of sorted (start, end) after
+        merging the regions which touch or overlap each other
+        """
+        regions = np.asarray(self._missing_region,
+                             dtype=float).reshape(-1, 2)
+        if len(regions) == 0:
+            return regions
+        regions = regions[np.argsort(regions[:, 0], kind="stable")]
+        ends = np.maximum.accumulate(regions[:, 1])
+        # Small tolerance so that touching regions are merged
+        first = np.flatnonzero(np.r_[True, regions[1:, 0] > ends[:-1] +
+                                     1e-9])
+        return np.column_stack([regions[first, 0],
+                                np.maximum.reduceat(regions[:, 1], first)])
+
     def make_ticks(self, values):
-        if self._ticks is not None:
+        if self._ticks is not None and not self._auto_ticks:
             self._log.info("Ticks for {} have already been set by "
                            "user".format(self.name))
             return
         self._ticks = values
+        self._auto_ticks = True
         self._log.info("Ticks for {} automatically set".format(self.name))
 
-    def make_labels(self):
-        if self._tick_labels is not None:
+    def make_labels(self, values=None):
+        if self._tick_labels is not None and not self._auto_labels:
             self._log.info("Tick labels for {} are already defined".format(
                 self.name))
             return
+        self._auto_labels = True
+        if values is not None and len(values) == len(self.ticks):
+            self._tick_labels = ["{}".format(x) for x in values]
+            self._log.info("{} tick_labels taken from the data".format(
+                self.name))
+            return
         self._tick_labels = ["{}".format(x) for x in range(len(self.ticks))]
         self._log.info("{} tick_labels automatically generated".format(
             self.name))
 
     def make_midlines(self):
-        if self.midlines is not None:
+        if self.midlines is not None and not self._auto_midlines:
             self._log.info("Generation of midlines ignored because they are "
                            "already generated")
             return
 
         self._midlines = []
+        self._auto_midlines = True
         if len(self.ticks) == 1:
             self._log.warn("{} midlines could not be generated because only "
                            "1 bar is present".format(self.name))
             return
 
-        for i, x in enumerate(self.ticks[:-1]):
-            self._midlines.append((x + self.ticks[i + 1]) / 2)
+        ticks = np.asarray(self.ticks, dtype=float)
+        self._midlines = ((ticks[:-1] + ticks[1:]) / 2).tolist()
         self._log.info("{} midlines automatically generated".format(self.name))
 
 
@@ -12,12 +12,119 @@
 
 
 import matplotlib.patches as patches
-import matplotlib.pyplot as plt
 import numpy as np
-from SecretColors import Palette
+from matplotlib.collections import PathCollection, PolyCollection
 from matplotlib.path import Path
 
-palette = Palette()
+from SecretPlots.utils import get_palette
+
+SHAPE_NAMES = {
+    "rectangle": ["r", "rectangle", "rect"],
+    "triangle": ["t", "triangle", "tri"],
+    "circle": ["c", "circle", "cir"]
+}
+
+
+def shape_name(value: str):
+    """
+    Full name of the given shape or None if it is not supported
+    """
+    value = value.strip().lower()
+    for name, aliases in SHAPE_NAMES.items():
+        if value in aliases:
+            return name
+    return None
+
+
+def corners(x, y, width, height, rotation=0.0) -> np.ndarray:
+    """
+    (N, 4, 2) corners of the rectangles with lower left corner at (x, y)
+    and rotated by 'rotation' degrees around it (same as
+    matplotlib.patches.Rectangle)
+    """
+    x, y, width, height, rotation = np.broadcast_arrays(
+        *[np.atleast_1d(np.asarray(v, dtype=float))
+          for v in (x, y, width, height, rotation)])
+    dx = np.stack([np.zeros_like(width), width, width,
+                   np.zeros_like(width)], axis=1)
+    dy = np.stack([np.zeros_like(height), np.zeros_like(height), height,
+                   height], axis=1)
+    theta = np.deg2rad(rotation)[:, None]
+    cos, sin = np.cos(theta), np.sin(theta)
+    return np.stack([x[:, None] + dx * cos - dy * sin,
+                     y[:, None] + dx * sin + dy * cos], axis=-1)
+
+
+def rectangle_vertices(x, y, width, height, rotation=0.0) -> np.ndarray:
+    """
+    (N, 5, 2) closed outlines of the rectangles
+    """
+    c = corners(x, y, width, height, rotation)
+    return np.concatenate([c, c[:, :1]], axis=1)
+
+
+def triangle_vertices(x, y, width, height, rotation=0.0) -> np.ndarray:
+    """
+    (N, 4, 2) closed outlines of the triangles with base on the bottom
+    side of the rectangle and apex at the middle of its top side
+    """
+    c = corners(x, y, width, height, rotation)
+    apex = (c[:, 2] + c[:, 3]) / 2
+    return np.stack([c[:, 0], c[:, 1], apex, c[:, 0]], axis=1)
+
+
+def circle_centers(x, y, width, height, rotation=0.0) -> np.ndarray:
+    """
+    (N, 2) centers of the ellipses inscribed in the rectangles
+    """
+    c = corners(x, y, width, height, rotation)
+    return (c[:, 0] + c[:, 2]) / 2
+
+
+def circle_vertices(x, y, width, height, rotation=0.0) -> np.ndarray:
+    """
+    (N, k, 2) Bezier control points of the ellipses inscribed in the
+    rectangles. Use with the codes of Path.unit_circle
+    """
+    unit = Path.unit_circle().vertices
+    center = circle_centers(x, y, width, height, rotation)
+    n = len(center)
+    width, height, rotation = [np.broadcast_to(np.asarray(v, dtype=float),
+                                               (n,))
+                               for v in (width, height, rotation)]
+    px = unit[:, 0] * width[:, None] / 2
+    py = unit[:, 1] * height[:, None] / 2
+    theta = np.deg2rad(rotation)[:, None]
+    cos, sin = np.cos(theta), np.sin(theta)
+    return np.stack([center[:, :1] + px * cos - py * sin,
+                     center[:, 1:] + px * sin + py * cos], axis=-1)
+
+
+def shape_vertices(shape: str, x, y, width, height, rotation=0.0) -> tuple:
+    """
+    Vertices of all the shapes at once as (N, k, 2) array together with
+    path codes for single shape (None for simple polygons)
+    """
+    name = shape_name(shape)
+    if name == "rectangle":
+        return rectangle_vertices(x, y, width, height, rotation), None
+    elif name == "triangle":
+        return triangle_vertices(x, y, width, height, rotation), None
+    elif name == "circle":
+        return (circle_vertices(x, y, width, height, rotation),
+                Path.unit_circle().codes)
+    raise Exception("Shape {} not found".format(shape))
+
+
+def shape_collection(shape: str, x, y, width, height, rotation=0.0,
+                     **kwargs):
+    """
+    All the shapes as a single collection
+    """
+    vertices, codes = shape_vertices(shape, x, y, width, height, rotation)
+    if codes is None:
+        return PolyCollection(vertices, closed=False, **kwargs)
+    return PathCollection([Path(v, codes) for v in vertices], **kwargs)
 
 
 class Rectangle:
@@ -60,7 +167,7 @@ class Rectangle:
     @property
     def options(self):
         if "color" not in self._options.keys():
-            self._options["color"] = palette.blue()
+            self._options["color"] = get_palette().blue()
         return self._options
 
     def get(self):
@@ -258,21 +365,12 @@ class Triangle:
     @property
     def options(self):
         if "color" not in self._options.keys():
-            self._options["color"] = palette.blue()
+            self._options["color"] = get_palette().blue()
         return self._options
 
-    def _get_rect(self):
-        return patches.Rectangle((self.x, self.y), self.width, self.height,
-                                 self.rotation)
-
     def get(self):
-        p = self._get_rect()
-        vert = p.get_verts()
-        t1 = vert[2]
-        t2 = vert[3]
-        vert = [x for x in vert[:2]]
-        vert.append(np.asarray([(t1[0] + t2[0]) / 2, (t1[1] + t2[1]) / 2]))
-        vert.append(vert[0])
+        vert = triangle_vertices(self.x, self.y, self.width, self.height,
+                                 self.rotation)[0]
         return patches.Polygon(vert, **self.options)
 
 
@@ -308,31 +406,12 @@ class Circle:
     @property
     def options(self):
         if "color" not in self._options.keys():
-            self._options["color"] = palette.blue()
+            self._options["color"] = get_palette().blue()
         return self._options
 
-    def _get_rect(self):
-        return patches.Rectangle((self.x, self.y), self.width, self.height,
-                                 self.rotation)
-
-    @staticmethod
-    def _get_diagonal_mid(points):
-        p1, p2, p3, p4 = points
-
-        m1 = (p3[1] - p1[1]) / (p3[0] - p1[0])
-        m2 = (p4[1] - p2[1]) / (p4[0] - p2[0])
-
-        c1 = p3[1] - m1 * p3[0]
-        c2 = p4[1] - m2 * p4[0]
-
-        x = (c2 - c1) / (m1 - m2)
-        y = m1 * x + c1
-
-        return x, y
-
     def get(self):
-        verts = self._get_rect().get_verts()
-        x, y = self._get_diagonal_mid(verts[:-1])
+        x, y = circle_centers(self.x, self.y, self.width, self.height,
+                              self.rotation)[0]
         return patches.Ellipse((x, y),
                                self.width,
                                self.height,
@@ -341,6 +420,7 @@ class Circle:
 
 
 def run():
+    import matplotlib.pyplot as plt
     fig, ax = plt.subplots()
     p = Circle(0, 0, 1, 1)
     p2 = Rectangle(0, 0, 1, 1, fill=False)
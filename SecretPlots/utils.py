@@ -5,6 +5,8 @@
 # Simple utils to use in the library
 
 import logging
+import threading
+from collections import OrderedDict
 
 
 class Log:
@@ -55,5 +57,139 @@ class Log:
             self.log_object.warning(message)
 
 
+class LRUCache:
+    """
+    Small process-wide cache which evicts least recently used items when
+    it is full. Hits and misses are counted to check its usefulness
+    """
+
+    def __init__(self, max_size: int = 128):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, factory):
+        """
+        Returns item stored with given key. If it is not present, it is
+        created by calling 'factory' and stored
+        """
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return self._items[key]
+            self.misses += 1
+        value = factory()
+        with self._lock:
+            self._items[key] = value
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def info(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses,
+                "size": len(self._items), "max_size": self.max_size}
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+
+# Colormaps, palettes and lookup tables shared by all the plots
+color_cache = LRUCache()
+
+
+def get_palette(name: str = "ibm", show_warning: bool = False):
+    """
+    Shared SecretColors Palette. Do not iterate over it directly as the
+    iteration state will also be shared, use 'get_color_list' instead
+    """
+
+    def _make():
+        from SecretColors import Palette
+        return Palette(name, show_warning=show_warning)
+
+    return color_cache.get(("palette", name, show_warning), _make)
+
+
+def new_figure():
+    """
+    New figure managed by pyplot, so that it can be shown interactively
+    """
+    import matplotlib.pyplot as plt
+    return plt.figure()
+
+
+def show_figure(fig, log: Log):
+    """
+    Shows the figure if it is managed by pyplot. Figures created directly
+    (e.g. matplotlib.figure.Figure()) can only be saved
+    """
+    if fig.canvas.manager is None:
+        log.warn("Figure is not managed by pyplot and can not be shown, "
+                 "use 'save' instead")
+        return
+    import matplotlib.pyplot as plt
+    plt.show()
+
+
+def close_figure(fig):
+    """
+    Releases the figure from pyplot (if it is managed by it) and removes
+    all of its artists
+    """
+    if fig.canvas.manager is not None:
+        import matplotlib.pyplot as plt
+        plt.close(fig)
+    fig.clear()
+
+
+class ClosablePlot:
+    """
+    Lifecycle shared by the plots. Subclasses should set '_closed' and
+    '_log', and release their resources in '_release'
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    @property
+    def is_closed(self):
+        return self._closed
+
+    def _check_open(self):
+        if self._closed:
+            self._log.error("Plot is already closed, create a new one")
+
+    def _release(self):
+        raise NotImplementedError
+
+    def close(self):
+        """
+        Releases the figure and all its artists. Plot can not be used after
+        this
+        """
+        if self._closed:
+            return
+        self._release()
+        self._closed = True
+        self._log.info("Plot is closed")
+
+
 def run():
     pass
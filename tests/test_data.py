@@ -0,0 +1,204 @@
+#  SecretPlots
+#  Copyright (c) 2019.  SecretBiology
+#
+#  Author: Rohit Suratekar
+#  Organisation: SecretBiology
+#  Website: https://github.com/secretBiology/SecretPlots
+#  Licence: MIT License
+#
+#
+# Tests for Data object
+
+import array
+
+import numpy as np
+import pytest
+
+from SecretPlots.objects import Axis, Data
+from SecretPlots.utils import Log
+
+
+@pytest.mark.parametrize("data", [
+    5,
+    [1, 2],
+    [[1, 2], [3, 4]],
+    [1, 2, 3, 4],
+    [[1], [2], [3]],
+    [[1, 2, 3]],
+    [[1, 2, 3], [4, 5, 6], [7, 8, 9]],
+])
+def test_type_from_shape(data):
+    expected = Data(data, Log()).type
+    assert Data(np.asarray(data), Log()).type == expected
+
+
+def test_type_buffer_protocol():
+    assert Data(array.array("d", [1, 2, 3]), Log()).type == \
+           Data.SIMPLE_CATEGORICAL
+
+
+def test_type_ragged():
+    d = Data([[1, 2], [3, 4, 5], [6]], Log())
+    assert d.type == Data.COMPLEX_CATEGORICAL
+    d = Data(np.asarray([[1, 2], [3, 4, 5], [6]], dtype=object), Log())
+    assert d.type == Data.COMPLEX_CATEGORICAL
+
+
+def test_positions():
+    d = Data(np.zeros((2, 3)) + 1, Log())
+    assert d.positions.shape == (6, 2)
+    assert d.positions.tolist() == [[0, 0], [0, 1], [0, 2],
+                                    [1, 0], [1, 1], [1, 2]]
+    d = Data([[1, 2], [3, 4, 5], [6]], Log())
+    assert d.positions.tolist() == [[0, 0], [0, 1], [1, 0], [1, 1],
+                                    [1, 2], [2, 0]]
+    d = Data([4, 5, 6], Log())
+    assert d.positions.tolist() == [[0, 0], [0, 1], [0, 2]]
+
+
+def test_ragged():
+    d = Data([[1, 2], [3, None, 5], 6], Log())
+    assert d.offsets.tolist() == [0, 2, 5, 6]
+    assert d.group_sizes.tolist() == [2, 3, 1]
+    assert d.group_sums.tolist() == [3, 8, 6]
+    assert np.isnan(d.value[3])
+    assert d.positions[:, 0].tolist() == [0, 0, 1, 1, 1, 2]
+
+
+def test_pandas_labels():
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [7.0, 8.0, 9.0]],
+                      index=["a", "b", "c"], columns=["x", "y", "z"])
+    d = Data(df, Log())
+    assert d.type == Data.MATRIX
+    assert d.row_labels == ["a", "b", "c"]
+    assert d.column_labels == ["x", "y", "z"]
+    assert d.value.tolist() == list(range(1, 10))
+
+    s = pd.Series([1.0, 2.0, 3.0], index=["a", "b", "c"])
+    d = Data(s, Log())
+    assert d.type == Data.SIMPLE_CATEGORICAL
+    assert d.column_labels == ["a", "b", "c"]
+    assert np.shares_memory(d.value, s.to_numpy())
+
+
+def test_memmap(tmp_path):
+    matrix = np.arange(20, dtype=float).reshape(5, 4)
+    matrix[2, 1] = np.nan
+    filename = str(tmp_path / "matrix.npy")
+    np.save(filename, matrix)
+    d = Data(filename, Log())
+    d.block_size = 8
+    assert d.is_memmap
+    assert d.type == Data.MATRIX
+    blocks = list(d.blocks())
+    assert len(blocks) == 3
+    assert np.concatenate([p for p, _, _ in blocks]).tolist() == \
+           Data(matrix, Log()).positions.tolist()
+    assert d.min == 0
+    assert d.max == 19
+
+
+def test_summary():
+    d = Data([[1, 2, 3], [4, None, 0]], Log())
+    s = d.summary
+    assert (s.min, s.max, s.sum, s.missing) == (0, 4, 10, 1)
+    assert s.row_max.tolist() == [3, 4]
+    assert s.column_min.tolist() == [1, 2, 0]
+    assert d.summary is s
+
+    d = Data([[1, 2], [3, None, 5], 6], Log())
+    assert d.summary.row_max.tolist() == [2, 5, 6]
+    assert d.summary.column_max.tolist() == [6, 2, 5]
+
+
+def test_dtype():
+    values = np.arange(6, dtype=np.float32).reshape(2, 3)
+    d = Data(values, Log())
+    assert d.value.dtype == np.float32
+    assert np.shares_memory(d.value, values)
+
+    d = Data([[1, None, 3], [4, 5, 6]], Log(), dtype=np.int32)
+    assert d.value.dtype == np.int32
+    assert d.mask.tolist() == [False, True, False, False, False, False]
+    assert (d.min, d.max, d.summary.missing) == (1, 6, 1)
+
+    d = Data([1, 2, 3], Log(), dtype="float32")
+    assert d.value.dtype == np.float32
+
+
+def test_masked_input():
+    values = np.ma.masked_array([[1, 2, 3], [4, 5, 6]],
+                                mask=[[0, 1, 0], [0, 0, 1]])
+    d = Data(values, Log())
+    assert d.mask.tolist() == [False, True, False, False, False, True]
+    assert np.shares_memory(d.value, values.data)
+    assert (d.min, d.max) == (1, 5)
+
+    pd = pytest.importorskip("pandas")
+    s = pd.Series([1, None, 3], dtype="Int64")
+    d = Data(s, Log())
+    assert d.value.dtype.kind == "i"
+    assert d.mask.tolist() == [False, True, False]
+
+
+@pytest.mark.parametrize("data", [
+    [1, 2, 3, 4],
+    [1, 2],
+    [[1, 2], [3, 4]],
+    [[1, 2, 3], [4, None, 6], [7, 8, 9]],
+    [[1, 2], [3, 4, 5], [6]],
+])
+def test_iterator(data):
+    expected = Data(data, Log())
+    d = Data(iter(data), Log())
+    assert d.type == expected.type
+    assert d.positions.tolist() == expected.positions.tolist()
+    assert d.mask.tolist() == expected.mask.tolist()
+    assert np.array_equal(d.value, expected.value, equal_nan=True)
+
+
+def test_generator_large():
+    d = Data((np.arange(x % 7) for x in range(5000)), Log())
+    assert d.type == Data.COMPLEX_CATEGORICAL
+    assert d.offsets[-1] == sum(x % 7 for x in range(5000))
+
+
+def test_append():
+    d = Data([1, 2, 3], Log())
+    _ = d.summary
+    assert d.append([4, None]) == 3
+    assert d.type == Data.SIMPLE_CATEGORICAL
+    assert d.positions[-2:].tolist() == [[0, 3], [0, 4]]
+    assert d.mask.tolist() == [False, False, False, False, True]
+    assert d.max == 4
+    assert d.summary.column_max.tolist()[:4] == [1, 2, 3, 4]
+
+    d = Data(np.arange(6).reshape(3, 2), Log())
+    d.append([[10, 11]])
+    assert d.type == Data.MATRIX
+    assert d.value.dtype.kind == "i"
+    assert d.positions[-1].tolist() == [3, 1]
+    d.append([[1, 2, 3]])
+    assert d.type == Data.COMPLEX_CATEGORICAL
+    assert d.offsets.tolist() == [0, 2, 4, 6, 8, 11]
+    assert d.group_sums.tolist() == [1, 5, 9, 21, 6]
+
+
+def test_append_labels():
+    d = Data([1, 2, 3], Log())
+    d.append([4, 5], labels=["a", "b"])
+    assert d.column_labels == [0, 1, 2, "a", "b"]
+    d.append([6], labels=["c"])
+    assert d.column_labels == [0, 1, 2, "a", "b", "c"]
+
+    d = Data([[1, 2], [3, 4]], Log())
+    d.append([[5, 6]], labels=["x"])
+    assert d.row_labels == [0, 1, "x"]
+
+
+def test_merged_missing_regions():
+    axis = Axis("x", 0, Log())
+    axis.add_missing_regions([3, 0, 1, 0.5, 6], 1)
+    assert axis.merged_missing_regions().tolist() == [[0, 2], [3, 4],
+                                                       [6, 7]]
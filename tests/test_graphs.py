@@ -0,0 +1,278 @@
+#  SecretPlots
+#  Copyright (c) 2019.  SecretBiology
+#
+#  Author: Rohit Suratekar
+#  Organisation: SecretBiology
+#  Website: https://github.com/secretBiology/SecretPlots
+#  Licence: MIT License
+#
+#
+# Tests for plots
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from matplotlib.figure import Figure
+
+from SecretPlots import (BarPlot, BarGroupedPlot, ColorPlot, HistPlot,
+                         FigurePool)
+
+
+def test_append_bars():
+    p = BarPlot([1, 2, 3])
+    p.draw()
+    first = list(p.ax.collections)
+    p.append([4, 5])
+    assert len(p.ax.collections) == 2
+    assert p.ax.collections[0] is first[0]
+    assert len(p.ax.collections[1].get_paths()) == 2
+    assert len(p.x.ticks) == 5
+
+
+def test_bar_collection():
+    p = BarPlot([1, None, 3, 4]).add_values()
+    p.draw()
+    # Bars and the missing region
+    assert len(p.ax.collections) == 2
+    assert len(p.ax.collections[0].get_paths()) == 3
+    assert len(p.ax.texts) == 4
+
+    p = BarPlot([1, None, 3, 4]).change_rendering(False)
+    p.draw()
+    assert len(p.ax.collections) == 1
+    assert len(p.ax.patches) == 3
+
+
+def test_append_colormap():
+    p = ColorPlot([[1, 2], [3, 4], [1, 1]]).change_rendering(
+        use_collection=False, use_raster=False)
+    p.draw()
+    p.append([[2, 2]])
+    assert len(p.ax.patches) == 8
+    p.append([[8, 2]])
+    assert len(p.ax.patches) == 10
+
+    p = ColorPlot([[1, 2], [3, 4], [1, 1]]).change_rendering(
+        use_raster=False)
+    p.draw()
+    p.append([[2, 2]])
+    assert len(p.ax.collections) == 2
+    # Maximum is changed, hence all cells are drawn again
+    p.append([[8, 2]])
+    assert len(p.ax.collections) == 1
+    assert len(p.ax.collections[0].get_paths()) == 10
+
+    # Without any value the maximum is NaN, cells should still be kept
+    p = ColorPlot([[None, None]]).change_rendering(
+        use_collection=False, use_raster=False)
+    p.draw()
+    first = p.ax.patches[0]
+    p.append([[None, None]])
+    assert p.ax.patches[0] is first
+
+
+def test_colormap_raster():
+    p = ColorPlot([[1, 2, 3], [3, None, 5]])
+    p.draw()
+    # Mesh and the missing cell
+    assert len(p.ax.collections) == 2
+    assert len(p.ax.collections[1].get_paths()) == 1
+    p.append([[9, 9, 9]])
+    assert len(p.ax.collections) == 2
+    assert p.ax.get_xlim() == (-1, 4)
+
+
+def test_colormap_raster_fallback():
+    p = ColorPlot([[1, 2], [3, 4]]).add_x_gap(0.1)
+    p.draw()
+    assert len(p.ax.collections) == 1
+    assert len(p.ax.collections[0].get_paths()) == 4
+    assert p.ax.collections[0].get_array() is None
+
+
+def test_memmap_colormap_is_not_rastered(tmp_path):
+    filename = str(tmp_path / "matrix.npy")
+    np.save(filename, np.arange(20, dtype=float).reshape(5, 4))
+    p = ColorPlot(filename)
+    p.assembler.data.block_size = 8
+    p.draw()
+    assert not p.assembler._can_raster()
+    # Cells are drawn block by block without loading the full matrix
+    assert p.assembler.data._value is None
+    assert all(c.get_array() is None for c in p.ax.collections)
+    assert sum(len(c.get_paths()) for c in p.ax.collections) == 20
+
+
+def test_values_are_culled():
+    p = ColorPlot(np.random.rand(100, 100)).add_values()
+    p.draw()
+    assert len(p.ax.texts) == 0
+    p = ColorPlot([[1, 2], [3, 4]]).add_values()
+    p.draw()
+    assert len(p.ax.texts) == 4
+
+
+def test_max_value_labels():
+    p = ColorPlot(np.arange(9).reshape(3, 3)).add_values(max_labels=4)
+    p.draw()
+    assert len(p.ax.texts) == 4
+    p = BarPlot([1, None, 3]).add_values()
+    p.draw()
+    assert len(p.ax.texts) == 3
+
+
+def test_decorations_are_collections():
+    p = BarGroupedPlot([[1, None, None], [4, 5], [6]])
+    p.add_x_midlines().add_x_edgelines()
+    p.draw()
+    assert len(p.ax.lines) == 0
+    midlines, edgelines, missing = p.ax.collections[1:]
+    assert len(midlines.get_paths()) == 2
+    assert len(edgelines.get_paths()) == 6
+    # Adjacent missing bars are shown as a single region
+    assert len(missing.get_paths()) == 1
+
+
+def test_masked_values_are_not_stacked():
+    masked = BarPlot(np.ma.masked_array([[1, 5, 2], [3, 4, 1]],
+                                        mask=[[0, 1, 0], [0, 0, 0]]))
+    missing = BarPlot([[1, np.nan, 2], [3, 4, 1]])
+    locations = [p.assembler.lm.get_array(p.assembler.data)
+                 for p in (masked, missing)]
+    assert np.array_equal(locations[0], locations[1])
+    assert locations[0][2].tolist() == [0, 1]
+
+
+def test_hist_streaming():
+    values = np.random.RandomState(0).randn(5000)
+    p = HistPlot(values, bins=12)
+    counts, edges = np.histogram(values, 12)
+    assert np.array_equal(p.counts, counts)
+    assert np.allclose(p.edges, edges)
+
+    chunks = (values[i:i + 1000] for i in range(0, 5000, 1000))
+    p = HistPlot(chunks, bins=8, bin_range=(-4, 4))
+    assert np.array_equal(p.counts, np.histogram(values, 8, (-4, 4))[0])
+    p.draw()
+    p.append([0.5, 0.5, 10, np.nan])
+    assert p.counts.sum() == 5002
+    assert len(p.ax.collections) == 1
+    assert len(p.x.ticks) == 9
+    with pytest.raises(Exception):
+        p.append([1], labels=["a"])
+
+
+def test_ticks_are_thinned():
+    p = ColorPlot(np.random.RandomState(0).rand(500, 3))
+    p.draw()
+    assert len(p.x.ticks) == 500
+    assert len(p.y.ticks) == 3
+    shown = p.ax.get_xticks()
+    assert 1 < len(shown) < 100
+    step = int(round(shown[1] - shown[0]))
+    assert np.allclose(shown, p.x.ticks[::step])
+    assert len(p.ax.get_xticklabels()) == len(shown)
+    assert len(p.ax.get_yticks()) == 3
+
+
+def test_grouped_ticks():
+    p = BarGroupedPlot([[1, 2], [3], [4, 5, 6]])
+    p.draw()
+    assert np.allclose(p.x.edgelines, [0, 2, 3, 4, 5, 8])
+    assert np.allclose(p.x.ticks, [1, 3.5, 6.5])
+    assert np.allclose(p.x.midlines, [2.5, 4.5])
+
+
+def _render(i):
+    if i % 2:
+        p = ColorPlot(np.arange(12).reshape(3, 4) * (i + 1), fig=Figure())
+        p.add_cmap().add_grid()
+    else:
+        p = BarPlot([[1, 2], [3, i]], fig=Figure()).add_legends().add_grid()
+    buffer = io.BytesIO()
+    p.save(buffer, format="png")
+    return buffer.getvalue()
+
+
+def test_bare_figures_in_threads():
+    serial = [_render(i) for i in range(8)]
+    with ThreadPoolExecutor(4) as executor:
+        assert list(executor.map(_render, range(8))) == serial
+
+
+def test_plots_are_closed():
+    figures = len(plt.get_fignums())
+    with BarPlot([1, 2, 3]) as p:
+        p.draw()
+        assert len(plt.get_fignums()) == figures + 1
+    assert len(plt.get_fignums()) == figures
+    assert p.is_closed and len(p.fig.axes) == 0
+    with pytest.raises(Exception):
+        p.draw()
+
+    p = ColorPlot([[1, 2], [3, 4]])
+    p.save(io.BytesIO(), format="png", close=True)
+    assert p.is_closed
+    p = HistPlot([1, 2, 2, 3])
+    p.auto_close = True
+    p.save(io.BytesIO(), format="png")
+    assert p.is_closed
+    assert len(plt.get_fignums()) == figures
+
+
+def _pooled_plots(pool=None):
+    def kwargs():
+        return {"pool": pool} if pool else {"fig": Figure()}
+
+    bars = BarPlot([[1, 2], [3, 4]], **kwargs())
+    bars.add_legends()
+    bars.add_grid()
+    bars.add_x_label("X")
+    bars.add_x_top_ticks()
+    bars.invert_y()
+    yield bars
+
+    colors = ColorPlot(np.arange(12).reshape(3, 4), **kwargs())
+    colors.add_cmap("Blues")
+    yield colors
+
+    square = ColorPlot(np.arange(6).reshape(2, 3), **kwargs())
+    square.change_aspect_ratio(1)
+    square.add_y_right_ticks()
+    square.add_values()
+    yield square
+
+    yield BarPlot([5, 3, 1], **kwargs())
+
+    colors = ColorPlot(np.arange(12).reshape(3, 4), **kwargs())
+    colors.add_cmap("Blues")
+    yield colors
+
+
+def test_figure_pool():
+    def render(p):
+        buffer = io.BytesIO()
+        p.save(buffer, format="png", close=True)
+        return buffer.getvalue()
+
+    fresh = [render(p) for p in _pooled_plots()]
+    pool = FigurePool(max_size=4)
+    for _ in range(2):
+        # Pooled figures should not keep anything from the previous plots
+        assert [render(p) for p in _pooled_plots(pool)] == fresh
+    assert pool.info == {"size": 2, "max_size": 4, "in_use": 0,
+                         "created": 2, "reused": 8, "released": 10,
+                         "discarded": 0}
+
+    # Pooled figures have their own layout
+    p = BarPlot([1, 2], pool=pool)
+    p.assembler.gm.ax_grid = Figure().add_gridspec(2, 2)
+    with pytest.raises(Exception):
+        p.draw()
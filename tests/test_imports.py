@@ -0,0 +1,49 @@
+#  SecretPlots
+#  Copyright (c) 2019.  SecretBiology
+#
+#  Author: Rohit Suratekar
+#  Organisation: SecretBiology
+#  Website: https://github.com/secretBiology/SecretPlots
+#  Licence: MIT License
+#
+#
+# Tests for package imports
+
+import json
+import os
+import subprocess
+import sys
+
+# Generous limit for importing the package without any plot, its real cost
+# is well below a millisecond
+IMPORT_BUDGET = 0.1
+
+SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import SecretPlots
+package = time.perf_counter() - start
+from SecretPlots.objects import Data
+from SecretPlots.network.pathfinder import PathFinder
+heavy = [m for m in ("matplotlib", "SecretColors") if m in sys.modules]
+print(json.dumps({"package": package, "heavy": heavy}))
+"""
+
+
+def _run(script):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    out = subprocess.run([sys.executable, "-c", script], check=True,
+                         capture_output=True, text=True, cwd=root).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def test_import_time_budget():
+    result = _run(SCRIPT)
+    assert result["heavy"] == []
+    assert result["package"] < IMPORT_BUDGET
+
+
+def test_plots_are_loaded_on_use():
+    result = _run("import json, SecretPlots;"
+                  "print(json.dumps(SecretPlots.BarPlot.__module__))")
+    assert result == "SecretPlots.graphs.categorical"
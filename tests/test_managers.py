@@ -0,0 +1,126 @@
+#  SecretPlots
+#  Copyright (c) 2019.  SecretBiology
+#
+#  Author: Rohit Suratekar
+#  Organisation: SecretBiology
+#  Website: https://github.com/secretBiology/SecretPlots
+#  Licence: MIT License
+#
+#
+# Tests for managers
+
+import numpy as np
+import pytest
+from matplotlib.colors import to_rgba
+
+from SecretPlots.constants import *
+from SecretPlots.managers import ColorManager, ObjectManager
+from SecretPlots.managers.location._bars import bin_counts
+from SecretPlots.managers.location._base import stack_offsets
+from SecretPlots.utils import Log, LRUCache, color_cache
+
+
+@pytest.mark.parametrize("plot_type", [PLOT_BAR, PLOT_STACKED_BAR,
+                                       PLOT_GROUPED_BAR, PLOT_BOOLEAN_PLOT])
+def test_colors_same_as_color(plot_type):
+    positions = np.array([[0, 0], [0, 1], [1, 0], [1, 2], [2, 1]])
+    values = np.array([0, 1, 0.5, 0, 2])
+    batch = ColorManager(plot_type, Log()).colors(positions, values)
+    single = ColorManager(plot_type, Log())
+    expected = [to_rgba(single.color(p, v)) for p, v in zip(positions,
+                                                            values)]
+    assert np.allclose(batch, expected)
+
+
+def test_colors_colormap():
+    cm = ColorManager(PLOT_COLOR_MAP, Log())
+    colors = cm.colors([[0, 0], [0, 1], [0, 2]], [0, 0.5, np.nan])
+    assert colors.shape == (3, 4)
+    assert np.allclose(colors[:2], cm.cmap([0, 0.5]))
+    assert np.allclose(colors[:, 3], 1)
+
+
+@pytest.mark.parametrize("cmap", [None, "viridis"])
+def test_lookup_table_same_as_cmap(cmap):
+    cm = ColorManager(PLOT_COLOR_MAP, Log())
+    cm.user_cmap = cmap
+    values = np.array([-1, 0, 0.3, 0.5, 0.999, 1, 2, np.inf, np.nan])
+    colors = cm.colors(np.zeros((len(values), 2)), values)
+    expected = cm.cmap(values)
+    expected[:, 3] = 1
+    assert np.allclose(colors, expected)
+
+
+def test_cmap_is_shared():
+    ColorManager(PLOT_COLOR_MAP, Log()).colors([[0, 0]], [0.5])
+    hits = color_cache.hits
+    cm = ColorManager(PLOT_COLOR_MAP, Log())
+    first = cm.cmap
+    cm.colors([[0, 0]], [0.5])
+    assert first is ColorManager(PLOT_COLOR_MAP, Log()).cmap
+    assert color_cache.hits > hits
+
+
+def test_lru_cache():
+    cache = LRUCache(2)
+    cache.get("a", lambda: 1)
+    cache.get("b", lambda: 2)
+    assert cache.get("a", lambda: 0) == 1
+    cache.get("c", lambda: 3)
+    assert "b" not in cache
+    assert "a" in cache
+    assert cache.info == {"hits": 1, "misses": 3, "size": 2, "max_size": 2}
+
+
+def test_user_cmap_is_reused():
+    cm = ColorManager(PLOT_COLOR_MAP, Log())
+    cm.user_cmap = "viridis"
+    assert cm.cmap is cm.cmap
+
+
+def test_boolean_cmap_is_pure():
+    cm = ColorManager(PLOT_BOOLEAN_PLOT, Log())
+    assert cm.boolean_cmap is cm.boolean_cmap
+    assert cm.all_colors == {}
+    cm.add_boolean_colors()
+    assert set(cm.all_colors) == {"ON", "OFF"}
+
+
+def test_stack_offsets():
+    groups = np.array([0, 0, 0, 1, 2, 2])
+    increments = np.array([0.1, 0.2, 0.3, 1, 0.7, 0.4])
+    expected = []
+    stack = 0
+    for i, g in enumerate(groups):
+        if i == 0 or g != groups[i - 1]:
+            stack = 0.5
+        expected.append(stack)
+        stack += increments[i]
+    assert np.array_equal(stack_offsets(groups, increments, 0.5), expected)
+    assert stack_offsets([], 1).shape == (0,)
+
+    # Long stacks should not lose any precision
+    increments = np.random.RandomState(0).rand(2000, 50)
+    expected = np.zeros_like(increments)
+    expected[:, 0] = 0.5
+    for i in range(1, 50):
+        expected[:, i] = expected[:, i - 1] + increments[:, i - 1]
+    groups = np.repeat(np.arange(2000), 50)
+    assert np.array_equal(stack_offsets(groups, increments.ravel(), 0.5),
+                          expected.ravel())
+
+
+def test_bin_counts():
+    values = np.array([0, 0.1, 0.25, 0.5, 0.99, 1, 1.5, -1, np.nan])
+    for edges in [np.linspace(0, 1, 5), np.array([0, 0.1, 0.7, 1])]:
+        expected = np.histogram(values[~np.isnan(values)], edges)[0]
+        assert np.array_equal(bin_counts(values, edges), expected)
+
+
+def test_element_bounds():
+    om = ObjectManager(None, ColorManager(PLOT_COLOR_MAP, Log()), Log())
+    om.width, om.height = 2, 0.5
+    om.add_bounds(*om.element_bounds([-3, 1, 4], [2, -1, 0], [1, 2, 3]))
+    assert (om.min_x, om.max_x, om.min_y, om.max_y) == (-3, 6, -1, 2.5)
+    om.add_bounds([], [], [], [])
+    assert (om.min_x, om.max_x) == (-3, 6)
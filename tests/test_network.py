@@ -10,6 +10,14 @@
 #
 # Tests for network module
 
+import io
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+from SecretPlots import NetworkPlot
 from SecretPlots.utils import Log
 from SecretPlots.network.pathfinder import PathFinder, Space
 import numpy as np
@@ -44,3 +52,11 @@ def test_space():
     assert len(s.nodes) == 4
     with pytest.raises(ValueError):
         s.max_cols = 1.5
+
+
+def test_network_plot_is_closed():
+    figures = len(plt.get_fignums())
+    with NetworkPlot([["a", "b", 1], ["a", "c", 1]]) as n:
+        n.save(io.BytesIO(), format="png")
+    assert n.is_closed
+    assert len(plt.get_fignums()) == figures
@@ -0,0 +1,43 @@
+#  SecretPlots
+#  Copyright (c) 2019.  SecretBiology
+#
+#  Author: Rohit Suratekar
+#  Organisation: SecretBiology
+#  Website: https://github.com/secretBiology/SecretPlots
+#  Licence: MIT License
+#
+#
+# Tests for shapes
+
+import matplotlib.patches as patches
+import numpy as np
+import pytest
+
+from SecretPlots.objects.shapes import *
+
+
+@pytest.mark.parametrize("rotation", [0, 30, 90, -135])
+def test_rectangle_vertices(rotation):
+    x, y = np.array([0, 1.5]), np.array([-1, 2])
+    vertices = rectangle_vertices(x, y, 2, 0.5, rotation)
+    assert vertices.shape == (2, 5, 2)
+    for i in range(2):
+        expected = patches.Rectangle((x[i], y[i]), 2, 0.5,
+                                     angle=rotation).get_verts()
+        assert np.allclose(vertices[i], expected)
+
+
+@pytest.mark.parametrize("rotation", [0, 45, 90])
+def test_circle_vertices(rotation):
+    # Diagonals of the rotated rectangle can be vertical
+    e = Circle(1, 1, 2, 1, rotation).get()
+    expected = e.get_patch_transform().transform(e.get_path().vertices)
+    assert np.allclose(circle_vertices(1, 1, 2, 1, rotation)[0], expected)
+
+
+def test_shape_collection():
+    c = shape_collection("tri", [0, 1, 2], 0, 1, [1, 2, 3])
+    assert len(c.get_paths()) == 3
+    assert np.allclose(c.get_paths()[2].vertices[2], [2.5, 3])
+    with pytest.raises(Exception):
+        shape_vertices("hexagon", 0, 0, 1, 1)